@@ -7,6 +7,7 @@ This script used to duplicate play/timing logic; it now delegates to
 import argparse
 import chess
 from scripts.agent_utils import create_agent, play_single_game_with_stats
+from scripts.play_agents import make_agents_play_parallel
 
 
 def main():
@@ -18,26 +19,43 @@ def main():
     parser.add_argument("--vi-iterations", type=int, default=3, help="ValueIteration iterations")
     parser.add_argument("--q-train", type=int, default=0, help="QLearning training episodes")
     parser.add_argument("--q-epsilon", type=float, default=0.0, help="QLearning epsilon during matches")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes to play games in parallel (0 = one per CPU)")
     args = parser.parse_args()
 
+    if args.processes != 1:
+        # Agents are rebuilt inside each worker from these picklable specs
+        kwargs = dict(depth=args.depth, vi_iterations=args.vi_iterations, q_numTraining=args.q_train, q_epsilon=args.q_epsilon)
+        print(f"Running {args.num_games} games: White={args.white_agent}, Black={args.black_agent}")
+        make_agents_play_parallel((args.white_agent, chess.WHITE, kwargs), (args.black_agent, chess.BLACK, kwargs),
+                                  iterations=args.num_games, processes=args.processes or None)
+        return
+
     white = create_agent(args.white_agent, chess.WHITE, depth=args.depth, vi_iterations=args.vi_iterations, q_numTraining=args.q_train, q_epsilon=args.q_epsilon)
     black = create_agent(args.black_agent, chess.BLACK, depth=args.depth, vi_iterations=args.vi_iterations, q_numTraining=args.q_train, q_epsilon=args.q_epsilon)
 
     print(f"Running {args.num_games} games: White={white}, Black={black}")
 
-    white_times = []
-    black_times = []
+    # Running totals for the mean move times, so no per-game list is kept
+    games = 0
+    white_total = 0.0
+    black_total = 0.0
+    # One board for the whole run; play_game resets it before each game
+    board = chess.Board()
 
     for i in range(1, args.num_games + 1):
         print(f"\n=== Game {i}/{args.num_games} ===")
-        result = play_single_game_with_stats(white, black)
+        white.reset_stats()
+        black.reset_stats()
+        result, w_avg, b_avg = play_single_game_with_stats(white, black, board=board)
+        games += 1
+        white_total += w_avg
+        black_total += b_avg
         print(f"Result: {result}")
 
 
-    if white_times:
-        print(f"\nWhite mean move time: {sum(white_times)/len(white_times):.4f}s")
-    if black_times:
-        print(f"Black mean move time: {sum(black_times)/len(black_times):.4f}s")
+    if games:
+        print(f"\nWhite mean move time: {white_total/games:.4f}s")
+        print(f"Black mean move time: {black_total/games:.4f}s")
 
 
 if __name__ == "__main__":
@@ -70,6 +70,24 @@ KEY_THEMES = [
 ]
 
 
+class Reservoir:
+    """Uniform random sample of fixed size from a stream (Algorithm R)."""
+
+    def __init__(self, size):
+        self.size = size
+        self.items = []
+        self.seen = 0
+
+    def add(self, item):
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        else:
+            slot = random.randrange(self.seen)
+            if slot < self.size:
+                self.items[slot] = item
+
+
 def create_puzzle_subset(
     input_file="data/lichess_db_puzzle.csv",
     output_file="data/puzzles.csv",
@@ -80,26 +98,43 @@ def create_puzzle_subset(
     stratified=True,
     seed=42
 ):
-    """Extract puzzles with good distribution across ratings and themes."""
+    """Extract puzzles with good distribution across ratings and themes.
+
+    The input is streamed once; only reservoirs of the sizes needed for the
+    final sample are kept in memory.
+    """
     
     random.seed(seed)
     
     print(f"Reading puzzles from {input_file}...")
     
-    # Organize puzzles by rating bracket
-    puzzles_by_bracket = defaultdict(list)
-    puzzles_by_theme = defaultdict(list)
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    # Reservoirs sized to the final budget
+    if stratified:
+        per_bracket = int(num_puzzles * 0.6) // len(RATING_BRACKETS)
+        # Themes overlap with bracket picks, keep spares to fill in after dedup
+        per_theme = int(num_puzzles * 0.4) // len(KEY_THEMES)
+        puzzles_by_bracket = {name: Reservoir(per_bracket) for _, _, name in RATING_BRACKETS}
+        puzzles_by_theme = {theme: Reservoir(2 * per_theme) for theme in KEY_THEMES}
+    else:
+        all_puzzles = Reservoir(num_puzzles)
+    
+    with open(input_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        # Plain rows rather than DictReader: a dict per row is too costly over
+        # millions of puzzles, so only the sampled rows are turned into dicts
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        if 'Rating' not in header or 'Themes' not in header:
+            raise ValueError(f"{input_file} has no Rating/Themes columns")
+        rating_idx = header.index('Rating')
+        themes_idx = header.index('Themes')
         
         for i, row in enumerate(reader):
             if i % 500000 == 0 and i > 0:
                 print(f"  Processed {i:,} puzzles...")
             
             try:
-                rating = int(row['Rating'])
-                themes = row['Themes'].split() if row.get('Themes') else []
+                rating = int(row[rating_idx])
+                themes = row[themes_idx].split()
                 
                 if rating < rating_min or rating > rating_max:
                     continue
@@ -109,24 +144,32 @@ def create_puzzle_subset(
                 
                 for min_r, max_r, name in RATING_BRACKETS:
                     if min_r <= rating < max_r:
-                        puzzles_by_bracket[name].append(row)
+                        if stratified:
+                            puzzles_by_bracket[name].add(row)
+                        else:
+                            all_puzzles.add(row)
                         break
                 
-                for theme in themes:
-                    if theme in KEY_THEMES:
-                        puzzles_by_theme[theme].append(row)
+                if stratified:
+                    for theme in themes:
+                        if theme in puzzles_by_theme:
+                            puzzles_by_theme[theme].add(row)
                         
-            except (ValueError, KeyError):
+            except (ValueError, IndexError):
                 continue
+
+    def as_dicts(rows):
+        return [dict(zip(header, row)) for row in rows]
     
     # Sample puzzles
     if stratified:
-        selected = sample_stratified(puzzles_by_bracket, puzzles_by_theme, num_puzzles)
+        selected = sample_stratified(
+            {name: as_dicts(r.items) for name, r in puzzles_by_bracket.items()},
+            {theme: as_dicts(r.items) for theme, r in puzzles_by_theme.items()},
+            num_puzzles,
+        )
     else:
-        all_puzzles = []
-        for puzzles in puzzles_by_bracket.values():
-            all_puzzles.extend(puzzles)
-        selected = random.sample(all_puzzles, min(num_puzzles, len(all_puzzles)))
+        selected = as_dicts(all_puzzles.items)
     
     # Write to output file
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
@@ -143,7 +186,11 @@ def create_puzzle_subset(
 
 
 def sample_stratified(puzzles_by_bracket, puzzles_by_theme, total_puzzles):
-    """Sample with equal distribution across ratings, ensuring theme coverage."""
+    """Combine per-bracket and per-theme reservoirs, ensuring theme coverage.
+
+    The reservoirs are already uniform samples, so this only deduplicates by
+    PuzzleId and trims each theme to its share of the budget.
+    """
     
     selected = {}
     
@@ -152,26 +199,18 @@ def sample_stratified(puzzles_by_bracket, puzzles_by_theme, total_puzzles):
     per_bracket = rating_budget // len(RATING_BRACKETS)
     
     for min_r, max_r, name in RATING_BRACKETS:
-        available = puzzles_by_bracket[name]
-        sample_size = min(per_bracket, len(available))
-        
-        if sample_size > 0:
-            sample = random.sample(available, sample_size)
-            for p in sample:
-                selected[p['PuzzleId']] = p
+        for p in puzzles_by_bracket.get(name, [])[:per_bracket]:
+            selected[p['PuzzleId']] = p
     
     # 40% from themes
     theme_budget = int(total_puzzles * 0.4)
     per_theme = theme_budget // len(KEY_THEMES)
     
     for theme in KEY_THEMES:
-        available = [p for p in puzzles_by_theme[theme] if p['PuzzleId'] not in selected]
-        sample_size = min(per_theme, len(available))
-        
-        if sample_size > 0:
-            sample = random.sample(available, sample_size)
-            for p in sample:
-                selected[p['PuzzleId']] = p
+        available = [p for p in puzzles_by_theme.get(theme, []) if p['PuzzleId'] not in selected]
+        random.shuffle(available)
+        for p in available[:per_theme]:
+            selected[p['PuzzleId']] = p
     
     return list(selected.values())
 
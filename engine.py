@@ -1,7 +1,177 @@
 import chess
-from evaluation import evaluate
+import chess.polyglot
+import os
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from evaluation import evaluate, PIECE_VALUES, PST_FLAT, pst_offset
 
-def find_best_move(board: chess.Board, depth: int) -> chess.Move:
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+# Score of a checkmate, matching evaluate()
+MATE_SCORE = 20000
+
+# Transposition table flags: the stored value is exact, a lower bound
+# (search failed high) or an upper bound (search failed low).
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Transposition table: zobrist hash -> (depth, flag, value, best_move)
+TT: Dict[int, Tuple[int, int, float, Optional[chess.Move]]] = {}
+
+# minimax's own table: zobrist hash -> (depth, value). minimax scores leaves
+# statically while alpha_beta runs a quiescence search, so they must not
+# share entries.
+MINIMAX_TT: Dict[int, Tuple[int, float]] = {}
+
+# Half-width of the aspiration window around the previous iteration's value
+ASPIRATION_WINDOW = 50
+
+# Killer moves: quiet moves that caused a beta cutoff, indexed by remaining depth
+MAX_DEPTH = 64
+KILLERS: List[List[chess.Move]] = [[] for _ in range(MAX_DEPTH)]
+
+
+class EvalState:
+    """
+    Material + middlegame piece-square score of a position, kept up to date
+    move by move with push_and_update / pop_and_restore instead of being
+    recomputed from scratch at every leaf.
+    """
+    __slots__ = ("score", "deltas")
+
+    def __init__(self, board: chess.Board):
+        self.score = pst_score(board)
+        self.deltas: List[int] = []
+
+
+def pst_score(board: chess.Board) -> int:
+    """Material + middlegame piece-square score, counted from scratch."""
+    score = 0
+    for piece_type in chess.PIECE_TYPES:
+        for color in chess.COLORS:
+            offset = pst_offset(piece_type, color)
+            for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                score += PST_FLAT[offset + square]
+    return score
+
+
+def push_and_update(board: chess.Board, move: chess.Move, state: EvalState) -> None:
+    """Push a move and apply its score change to the incremental evaluation."""
+    delta = move_delta(board, move)
+    board.push(move)
+    state.score += delta
+    state.deltas.append(delta)
+
+
+def move_delta(board: chess.Board, move: chess.Move) -> int:
+    """Change in pst_score that playing move (not yet pushed) would cause."""
+    if not move:
+        return 0 # null move
+    from_square, to_square = move.from_square, move.to_square
+    piece_type = board.piece_type_at(from_square) or chess.PAWN
+    color = board.turn
+
+    delta = PST_FLAT[pst_offset(move.promotion or piece_type, color) + to_square] \
+        - PST_FLAT[pst_offset(piece_type, color) + from_square]
+
+    if board.is_en_passant(move):
+        captured_square = to_square - 8 if color == chess.WHITE else to_square + 8
+        delta -= PST_FLAT[pst_offset(chess.PAWN, not color) + captured_square]
+    elif board.is_castling(move):
+        # The rook jumps from the corner to the other side of the king
+        rank = chess.square_rank(from_square)
+        if chess.square_file(to_square) > chess.square_file(from_square):
+            rook_from, rook_to = chess.square(7, rank), chess.square(5, rank)
+        else:
+            rook_from, rook_to = chess.square(0, rank), chess.square(3, rank)
+        rook_offset = pst_offset(chess.ROOK, color)
+        delta += PST_FLAT[rook_offset + rook_to] - PST_FLAT[rook_offset + rook_from]
+    else:
+        captured_type = board.piece_type_at(to_square)
+        if captured_type:
+            delta -= PST_FLAT[pst_offset(captured_type, not color) + to_square]
+    return delta
+
+
+def pop_and_restore(board: chess.Board, state: EvalState) -> None:
+    """Undo the last push_and_update."""
+    board.pop()
+    state.score -= state.deltas.pop()
+
+
+def evaluate_incremental(board: chess.Board, state: EvalState) -> int:
+    """Static evaluation from the incremental score, same result as evaluate_static."""
+    return _with_king_phase(board, state.score)
+
+
+def _with_king_phase(board: chess.Board, score: int) -> int:
+    """Turn a pst_score into the static evaluation by fixing up the king tables."""
+    queens = chess.popcount(board.queens)
+    if queens == 0 or (queens == 1 and chess.popcount(board.rooks | board.bishops | board.knights) <= 4):
+        # Endgame: swap the middlegame king tables for the endgame ones
+        for color in chess.COLORS:
+            king_square = board.king(color)
+            if king_square is not None:
+                score += (PST_FLAT[pst_offset(chess.KING, color, True) + king_square]
+                          - PST_FLAT[pst_offset(chess.KING, color, False) + king_square])
+    return score
+
+
+def mvv_lva(board: chess.Board, move: chess.Move) -> int:
+    """
+    Most-valuable-victim / least-valuable-attacker score of a capture.
+
+    Returns:
+        int: 10 * victim value - attacker value, or 0 for quiet moves
+    """
+    if not board.is_capture(move):
+        return 0
+    # En passant captures land on an empty square
+    victim = board.piece_type_at(move.to_square) or chess.PAWN
+    attacker = board.piece_type_at(move.from_square) or chess.PAWN
+    return 10 * PIECE_VALUES[victim] - PIECE_VALUES[attacker]
+
+
+def order_moves(board: chess.Board, depth: int, tt_move: Optional[chess.Move] = None) -> List[chess.Move]:
+    """
+    Order moves so the likeliest cutoffs are searched first: the
+    transposition table move, then captures by MVV-LVA, then killer moves.
+    """
+    killers = KILLERS[depth] if depth < MAX_DEPTH else ()
+    is_capture = board.is_capture
+
+    def score(move: chess.Move) -> int:
+        if move == tt_move:
+            return 1000000
+        if is_capture(move):
+            return 100000 + mvv_lva(board, move)
+        if move in killers:
+            return 50000
+        return 0
+
+    return sorted(board.legal_moves, key=score, reverse=True)
+
+
+def store_killer(move: chess.Move, depth: int) -> None:
+    """Remember a quiet move that caused a beta cutoff at this depth."""
+    if depth >= MAX_DEPTH:
+        return
+    killers = KILLERS[depth]
+    if move not in killers:
+        killers.insert(0, move)
+        del killers[2:]
+
+
+def clear_search_tables() -> None:
+    """Reset the transposition tables and killer moves before a new root search."""
+    TT.clear()
+    MINIMAX_TT.clear()
+    for killers in KILLERS:
+        killers.clear()
+
+def find_best_move(board: chess.Board, depth: int) -> Optional[chess.Move]:
     """
     Find the best move for the current player, given that they will look ahead 'depth' moves.
     
@@ -12,8 +182,9 @@ def find_best_move(board: chess.Board, depth: int) -> chess.Move:
     Returns:
         chess.Move: The best move found, or None if no moves available.
     """
+    clear_search_tables()
     best_move = None
-    best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
+    best_value = NEG_INF if board.turn == chess.WHITE else POS_INF
     
     # Try all legal moves
     for move in board.legal_moves:
@@ -33,26 +204,122 @@ def find_best_move(board: chess.Board, depth: int) -> chess.Move:
                 best_move = move
     return best_move
 
-def find_best_move_alpha_beta(board: chess.Board, depth: int) -> chess.Move:
+def find_best_move_alpha_beta(board: chess.Board, depth: int, workers: Optional[int] = 1) -> Optional[chess.Move]:
     """
     Find the best move for the current player using the alpha-beta pruning algorithm.
+
+    Searches with iterative deepening: each depth from 1 up to 'depth' is
+    searched in turn, trying the previous iteration's best move first and
+    using an aspiration window around its value.
+
+    With workers > 1 the final iteration is split across processes: the
+    previous best move is searched first and its value bounds the window
+    for the remaining root moves, which are searched in parallel.
     
     Args:
         board: chess.Board object
         depth: int, depth of search (plies)
+        workers: int, processes for the final iteration (None = one per CPU)
     
     Returns:
         chess.Move: The best move found, or None if no moves available.
     """
+    clear_search_tables()
     best_move = None
-    best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
-    alpha = float('-inf')
-    beta = float('inf')
+    best_value = None
+    parallel = (workers is None or workers > 1) and depth > 1
+    serial_depth = depth - 1 if parallel else depth
 
-    for move in board.legal_moves:
-        board.push(move)
-        move_value = alpha_beta(board, depth - 1, alpha, beta, board.turn == chess.WHITE)
-        board.pop()
+    for current_depth in range(1, serial_depth + 1):
+        if best_value is None:
+            move, value = search_root(board, current_depth, NEG_INF, POS_INF, best_move)
+        else:
+            alpha = best_value - ASPIRATION_WINDOW
+            beta = best_value + ASPIRATION_WINDOW
+            move, value = search_root(board, current_depth, alpha, beta, best_move)
+            # Fell outside the window: the value is only a bound, search again
+            if value <= alpha or value >= beta:
+                move, value = search_root(board, current_depth, NEG_INF, POS_INF, best_move)
+
+        if move is None:
+            return None
+        best_move, best_value = move, value
+
+    if parallel:
+        best_move, best_value = search_root_parallel(board, depth, best_move, workers)
+
+    return best_move
+
+def search_root_parallel(board: chess.Board, depth: int, pv_move: Optional[chess.Move],
+                         workers: Optional[int] = None) -> Tuple[Optional[chess.Move], float]:
+    """
+    Search the root with the principal move first, then the rest in parallel.
+
+    Each remaining move is searched in a worker process with the window
+    bounded by the best value found so far, so only moves that beat it
+    return exact scores.
+
+    Returns:
+        tuple: (best_move, best_value)
+    """
+    moves = order_moves(board, depth, pv_move)
+    if not moves:
+        return None, NEG_INF
+
+    white_to_move = board.turn == chess.WHITE
+    best_move = moves[0]
+    board.push(best_move)
+    best_value = alpha_beta(board, depth - 1, NEG_INF, POS_INF, not white_to_move)
+    board.pop()
+
+    if white_to_move:
+        alpha, beta = best_value, POS_INF
+    else:
+        alpha, beta = NEG_INF, best_value
+
+    fen = board.fen()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(_search_after_move, fen, move.uci(), depth - 1, alpha, beta): move
+            for move in moves[1:]
+        }
+        for future in as_completed(futures):
+            value = future.result()
+            if (white_to_move and value > best_value) or (not white_to_move and value < best_value):
+                best_value = value
+                best_move = futures[future]
+
+    return best_move, best_value
+
+def _search_after_move(fen: str, uci: str, depth: int, alpha: float, beta: float) -> float:
+    """Worker entry point: rebuild the root, play one move and search it."""
+    board = chess.Board(fen)
+    board.push_uci(uci)
+    return alpha_beta(board, depth, alpha, beta, board.turn == chess.WHITE)
+
+def search_root(board: chess.Board, depth: int, alpha: float, beta: float,
+                pv_move: Optional[chess.Move] = None) -> Tuple[Optional[chess.Move], float]:
+    """
+    Search every root move with alpha-beta inside the window (alpha, beta).
+
+    Args:
+        board: chess.Board object
+        depth: int, depth of search (plies)
+        alpha: float, lower bound of the search window
+        beta: float, upper bound of the search window
+        pv_move: best move from the previous iteration, searched first
+
+    Returns:
+        tuple: (best_move, best_value), best_move is None if no moves available
+    """
+    best_move = None
+    best_value = NEG_INF if board.turn == chess.WHITE else POS_INF
+    state = EvalState(board)
+
+    for move in order_moves(board, depth, pv_move):
+        push_and_update(board, move, state)
+        move_value = alpha_beta_iterative(board, depth - 1, alpha, beta, board.turn == chess.WHITE, state)
+        pop_and_restore(board, state)
 
         if board.turn == chess.WHITE:
             if move_value > best_value:
@@ -65,9 +332,12 @@ def find_best_move_alpha_beta(board: chess.Board, depth: int) -> chess.Move:
                 best_move = move
             beta = min(beta, move_value)
 
-    return best_move
+        if beta <= alpha:
+            break
+
+    return best_move, best_value
 
-def minimax(board: chess.Board, depth: int, maximizing: bool) -> int:
+def minimax(board: chess.Board, depth: int, maximizing: bool) -> float:
     """
     Minimax algorithm - recursively search the game tree.
     
@@ -82,28 +352,43 @@ def minimax(board: chess.Board, depth: int, maximizing: bool) -> int:
     # Base case: reached max depth or game is over
     if depth == 0 or board.is_game_over():
         return evaluate(board)
+
+    # Reuse the value of a transposed position searched at least as deep
+    key = chess.polyglot.zobrist_hash(board)
+    entry = MINIMAX_TT.get(key)
+    if entry is not None and entry[0] >= depth:
+        return entry[1]
+
+    # Bind the hot board methods once per node
+    push = board.push
+    pop = board.pop
     
     if maximizing:
         # White's turn - maximize the score
-        max_eval = float('-inf')
+        max_eval = NEG_INF
         
         for move in board.legal_moves:
-            board.push(move)
+            push(move)
             eval = minimax(board, depth - 1, False)
-            board.pop()
-            max_eval = max(max_eval, eval)
+            pop()
+            if eval > max_eval:
+                max_eval = eval
+        MINIMAX_TT[key] = (depth, max_eval)
         return max_eval
     else:
         # Black's turn - minimize the score
-        min_eval = float('inf')
+        min_eval = POS_INF
         for move in board.legal_moves:
-            board.push(move)
+            push(move)
             eval = minimax(board, depth - 1, True)
-            board.pop()
-            min_eval = min(min_eval, eval)
+            pop()
+            if eval < min_eval:
+                min_eval = eval
+        MINIMAX_TT[key] = (depth, min_eval)
         return min_eval
 
-def alpha_beta(board: chess.Board, depth: int, alpha: float, beta: float, maximizing: bool) -> float:
+def alpha_beta(board: chess.Board, depth: int, alpha: float, beta: float, maximizing: bool,
+               state: Optional[EvalState] = None) -> float:
     """
     Alpha-beta pruning search. - optimized minimax that skips irrelevant branches
     
@@ -113,35 +398,262 @@ def alpha_beta(board: chess.Board, depth: int, alpha: float, beta: float, maximi
         alpha: int, best value maximizer can guarantee, initially -inf
         beta: int, best value minimizer can guarantee, initially inf
         maximizing: bool, True if maximizing player, False if minimizing player
+        state: EvalState of the position, created from the board if omitted
 
     Returns:
         int: The evaluation score for the position
     """
-    if depth == 0 or board.is_game_over():
-        return evaluate(board)
+    if state is None:
+        state = EvalState(board)
+    if depth == 0:
+        return quiesce(board, alpha, beta, state)
+
+    # Probe the transposition table: an entry searched at least as deep
+    # either answers the node outright or tightens the window
+    key = chess.polyglot.zobrist_hash(board)
+    entry = TT.get(key)
+    tt_move = None
+    if entry is not None:
+        tt_move = entry[3]
+    if entry is not None and entry[0] >= depth:
+        flag, value = entry[1], entry[2]
+        if flag == EXACT:
+            return value
+        elif flag == LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    # No legal moves: checkmate or stalemate, no need for is_game_over()
+    moves = order_moves(board, depth, tt_move)
+    if not moves:
+        return terminal_score(board)
+
+    alpha_orig, beta_orig = alpha, beta
+    best_move = None
+
+    is_capture = board.is_capture
 
     if maximizing:
-        max_eval = float('-inf')
-        for move in board.legal_moves:
-            board.push(move)
-            eval = alpha_beta(board, depth - 1, alpha, beta, False)
-            board.pop()
-            max_eval = max(max_eval, eval)
-            alpha = max(alpha, eval)
+        max_eval = NEG_INF
+        for move in moves:
+            push_and_update(board, move, state)
+            eval = alpha_beta(board, depth - 1, alpha, beta, False, state)
+            pop_and_restore(board, state)
+            if eval > max_eval:
+                max_eval = eval
+                best_move = move
+            if eval > alpha:
+                alpha = eval
             if beta <= alpha:
+                if not is_capture(move):
+                    store_killer(move, depth)
                 break
-        return max_eval
+        value = max_eval
     else:
-        min_eval = float('inf')
-        for move in board.legal_moves:
-            board.push(move)
-            eval = alpha_beta(board, depth - 1, alpha, beta, True)
-            board.pop()
-            min_eval = min(min_eval, eval)
-            beta = min(beta, eval)
+        min_eval = POS_INF
+        for move in moves:
+            push_and_update(board, move, state)
+            eval = alpha_beta(board, depth - 1, alpha, beta, True, state)
+            pop_and_restore(board, state)
+            if eval < min_eval:
+                min_eval = eval
+                best_move = move
+            if eval < beta:
+                beta = eval
             if beta <= alpha:
+                if not is_capture(move):
+                    store_killer(move, depth)
                 break
-        return min_eval
+        value = min_eval
+
+    if value <= alpha_orig:
+        flag = UPPER
+    elif value >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    TT[key] = (depth, flag, value, best_move)
+    return value
+
+
+# Fields of a frame on the alpha_beta_iterative work stack
+_DEPTH, _ALPHA, _BETA, _MAXIMIZING, _MOVES, _INDEX, _BEST_VALUE, _BEST_MOVE, _ALPHA_ORIG, _BETA_ORIG, _KEY = range(11)
+
+
+def _enter_node(board: chess.Board, depth: int, alpha: float, beta: float, maximizing: bool,
+                state: EvalState, stack: list) -> Optional[float]:
+    """
+    Open a node for alpha_beta_iterative: return its value if it can be
+    resolved without searching children, otherwise push its frame and
+    return None.
+    """
+    if depth == 0:
+        return quiesce(board, alpha, beta, state)
+
+    key = chess.polyglot.zobrist_hash(board)
+    entry = TT.get(key)
+    tt_move = None
+    if entry is not None:
+        tt_move = entry[3]
+    if entry is not None and entry[0] >= depth:
+        flag, value = entry[1], entry[2]
+        if flag == EXACT:
+            return value
+        elif flag == LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    moves = order_moves(board, depth, tt_move)
+    if not moves:
+        return terminal_score(board)
+
+    stack.append([depth, alpha, beta, maximizing, moves, 0,
+                  NEG_INF if maximizing else POS_INF, None, alpha, beta, key])
+    return None
+
+
+def alpha_beta_iterative(board: chess.Board, depth: int, alpha: float, beta: float, maximizing: bool,
+                         state: Optional[EvalState] = None) -> float:
+    """
+    Alpha-beta search driven by an explicit work stack instead of recursion.
+
+    Same algorithm and result as alpha_beta (which stays as the reference
+    version): transposition table, move ordering, killer moves and
+    quiescence at the leaves.
+
+    Args:
+        board: chess.Board object
+        depth: int, depth of search (plies)
+        alpha: float, best value maximizer can guarantee, initially -inf
+        beta: float, best value minimizer can guarantee, initially inf
+        maximizing: bool, True if maximizing player, False if minimizing player
+        state: EvalState of the position, created from the board if omitted
+
+    Returns:
+        float: The evaluation score for the position
+    """
+    if state is None:
+        state = EvalState(board)
+    stack: list = []
+    value = _enter_node(board, depth, alpha, beta, maximizing, state, stack)
+
+    while stack:
+        frame = stack[-1]
+        moves = frame[_MOVES]
+
+        if value is not None:
+            # A child has been resolved: back its value up into this frame
+            pop_and_restore(board, state)
+            move = moves[frame[_INDEX] - 1]
+            if frame[_MAXIMIZING]:
+                if value > frame[_BEST_VALUE]:
+                    frame[_BEST_VALUE] = value
+                    frame[_BEST_MOVE] = move
+                if value > frame[_ALPHA]:
+                    frame[_ALPHA] = value
+            else:
+                if value < frame[_BEST_VALUE]:
+                    frame[_BEST_VALUE] = value
+                    frame[_BEST_MOVE] = move
+                if value < frame[_BETA]:
+                    frame[_BETA] = value
+
+            cutoff = frame[_BETA] <= frame[_ALPHA]
+            if cutoff and not board.is_capture(move):
+                store_killer(move, frame[_DEPTH])
+
+            if cutoff or frame[_INDEX] == len(moves):
+                # Node finished: store it and hand its value to the parent
+                stack.pop()
+                value = frame[_BEST_VALUE]
+                if value <= frame[_ALPHA_ORIG]:
+                    flag = UPPER
+                elif value >= frame[_BETA_ORIG]:
+                    flag = LOWER
+                else:
+                    flag = EXACT
+                TT[frame[_KEY]] = (frame[_DEPTH], flag, value, frame[_BEST_MOVE])
+                continue
+
+        # Descend into the next child of the frame on top of the stack
+        move = moves[frame[_INDEX]]
+        frame[_INDEX] += 1
+        push_and_update(board, move, state)
+        value = _enter_node(board, frame[_DEPTH] - 1, frame[_ALPHA], frame[_BETA],
+                            not frame[_MAXIMIZING], state, stack)
+
+    assert value is not None
+    return value
+
+
+def terminal_score(board: chess.Board) -> float:
+    """Score of a position without legal moves: checkmate if in check, else stalemate."""
+    if board.is_check():
+        return -MATE_SCORE if board.turn == chess.WHITE else MATE_SCORE
+    return 0
+
+
+def quiesce(board: chess.Board, alpha: float, beta: float, state: Optional[EvalState] = None) -> float:
+    """
+    Quiescence search - keep searching captures until the position is quiet,
+    so leaf evaluations are not taken in the middle of an exchange.
+
+    The side to move may always "stand pat" on the static evaluation
+    instead of capturing.
+
+    Args:
+        board: chess.Board object
+        alpha: float, best value maximizer can guarantee
+        beta: float, best value minimizer can guarantee
+        state: EvalState of the position, created from the board if omitted
+
+    Returns:
+        float: The evaluation score for the position, clamped to [alpha, beta]
+    """
+    # Checkmate, stalemate and dead draws are scored as such, not as material
+    if not any(board.generate_legal_moves()):
+        return terminal_score(board)
+    if not (board.pawns | board.rooks | board.queens) and board.is_insufficient_material():
+        return 0
+
+    if state is None:
+        state = EvalState(board)
+    stand_pat = evaluate_incremental(board, state)
+    captures = sorted(board.generate_legal_captures(),
+                      key=lambda move: mvv_lva(board, move), reverse=True)
+
+    if board.turn == chess.WHITE:
+        if stand_pat >= beta:
+            return beta
+        alpha = max(alpha, stand_pat)
+        for move in captures:
+            push_and_update(board, move, state)
+            score = quiesce(board, alpha, beta, state)
+            pop_and_restore(board, state)
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        return alpha
+    else:
+        if stand_pat <= alpha:
+            return alpha
+        beta = min(beta, stand_pat)
+        for move in captures:
+            push_and_update(board, move, state)
+            score = quiesce(board, alpha, beta, state)
+            pop_and_restore(board, state)
+            if score <= alpha:
+                return alpha
+            if score < beta:
+                beta = score
+        return beta
 
 
 if __name__ == "__main__":
@@ -173,6 +685,7 @@ if __name__ == "__main__":
     print()
     
     # Make the move and show the result
+    assert best_move_ab is not None
     board.push(best_move_ab)
     print("After AI move:")
     print(board)
\ No newline at end of file
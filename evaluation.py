@@ -1,6 +1,8 @@
 # How good is this position??
 
 import chess
+from collections import OrderedDict
+from typing import Hashable, List, Tuple
 
 # Piece values in centipawns
 PIECE_VALUES = {
@@ -12,6 +14,10 @@ PIECE_VALUES = {
     chess.KING: 20000 # Essentially infinite
 }
 
+# Piece values indexed by piece type (index 0 unused, king counted as 0)
+_PT_VALUES = (0, PIECE_VALUES[chess.PAWN], PIECE_VALUES[chess.KNIGHT], PIECE_VALUES[chess.BISHOP],
+              PIECE_VALUES[chess.ROOK], PIECE_VALUES[chess.QUEEN], 0)
+
 # Piece-Square Tables
 # These tables assign bonuses/penalties based on piece position
 # Values are from White's perspective; for Black, they are mirrored
@@ -105,6 +111,45 @@ PIECE_SQUARE_TABLES = {
     chess.KING: KING_MIDDLEGAME_TABLE # For simplicity, using middlegame table
 }
 
+def _flatten_table(table: List[List[int]], color: chess.Color) -> List[int]:
+    """Flatten a [rank][file] table into a list indexed by square, mirrored for Black."""
+    if color == chess.WHITE:
+        return [table[chess.square_rank(sq)][chess.square_file(sq)] for sq in chess.SQUARES]
+    return [table[7 - chess.square_rank(sq)][chess.square_file(sq)] for sq in chess.SQUARES]
+
+def pst_offset(piece_type: chess.PieceType, color: chess.Color, endgame: bool = False) -> int:
+    """Start of the 64-square block for (piece_type, color, endgame) in PST_FLAT."""
+    return ((piece_type * 2 + color) * 2 + endgame) * 64
+
+def _build_pst() -> Tuple[int, ...]:
+    """
+    Build one flat table of signed material + piece-square values.
+
+    Blocks of 64 squares are laid out by (piece_type, color, endgame), see
+    pst_offset. Black's entries are mirrored and negated so evaluate only
+    has to add them up.
+    """
+    pst = [0] * pst_offset(chess.KING + 1, chess.WHITE)
+    for piece_type, table in PIECE_SQUARE_TABLES.items():
+        for endgame in (False, True):
+            source = KING_ENDGAME_TABLE if piece_type == chess.KING and endgame else table
+            material_value = PIECE_VALUES[piece_type]
+            for color, sign in ((chess.WHITE, 1), (chess.BLACK, -1)):
+                offset = pst_offset(piece_type, color, endgame)
+                for square, value in enumerate(_flatten_table(source, color)):
+                    pst[offset + square] = sign * (material_value + value)
+    return tuple(pst)
+
+PST_FLAT = _build_pst()
+
+# Cache of evaluated positions: transposition key -> score
+# Once it holds EVAL_CACHE_SIZE entries the oldest entry is evicted per insert.
+# An OrderedDict pops its oldest entry in constant time; deleting the first key
+# of a plain dict slows down as deleted slots pile up at its front. Each entry
+# costs about 320 bytes, so the bound is about 32 MB per process.
+_EVAL_CACHE: "OrderedDict[Hashable, int]" = OrderedDict()
+EVAL_CACHE_SIZE = 100_000
+
 def is_endgame(board: chess.Board) -> bool:
     """
     Determine if the game is in the endgame phase.
@@ -116,61 +161,49 @@ def is_endgame(board: chess.Board) -> bool:
         bool: True if endgame, False otherwise
     """
     # Count queens
-    queens = len(board.pieces(chess.QUEEN, chess.WHITE)) + len(board.pieces(chess.QUEEN, chess.BLACK))
+    queens = chess.popcount(board.queens)
     if queens == 0:
         return True
     
     if queens == 1:
         # Count minor and major pieces
-        minors_majors = (
-            len(board.pieces(chess.ROOK, chess.WHITE)) +
-            len(board.pieces(chess.BISHOP, chess.WHITE)) +
-            len(board.pieces(chess.KNIGHT, chess.WHITE)) +
-            len(board.pieces(chess.ROOK, chess.BLACK)) +
-            len(board.pieces(chess.BISHOP, chess.BLACK)) +
-            len(board.pieces(chess.KNIGHT, chess.BLACK))
-        )
+        minors_majors = chess.popcount(board.rooks | board.bishops | board.knights)
         if minors_majors <= 4:
             return True
 
     return False
 
-def get_piece_square_value(piece: chess.Piece, square: chess.Square, endgame=False) -> int:
+def evaluate(board: chess.Board, ply: int = 0) -> int:
     """
-    Get the piece-square table value for a given piece on a given square.
+    Evaluate the current board position.
     
     Args:
-        piece: chess.Piece object
-        square: chess.Square
-        endgame: bool indicating if it's endgame phase
+        board: chess.Board object
+        
     Returns:
-        int: Piece-square table value
+        int: Score is in centipawns. (positive = white advantage, negative = black advantage)
     """
-    piece_type = piece.piece_type
-    
-    # Get rank and file
-    rank = chess.square_rank(square)
-    file = chess.square_file(square)
-    
-    # For black pieces, mirror the rank
-    if piece.color == chess.BLACK:
-        rank = 7 - rank
-    
-    if piece_type == chess.KING and endgame:
-        table = KING_ENDGAME_TABLE
-    else:
-        table = PIECE_SQUARE_TABLES[piece_type]
-        
-    if table is None:
-        return 0
+    # One probe for a legal move settles both checkmate and stalemate;
+    # most positions have one, so neither full check is needed
+    if not any(board.generate_legal_moves()):
+        if board.is_check():
+            # Prefer faster mates by reducing the magnitude with ply distance
+            mate_score = 20000 - ply
+            return -mate_score if board.turn == chess.WHITE else mate_score
+        return 0 # stalemate -> draw
 
-    value = table[rank][file]
-    return value
+    # Insufficient material needs no pawns, rooks or queens on the board;
+    # check the bitboards before the full test
+    if not (board.pawns | board.rooks | board.queens) and board.is_insufficient_material():
+        return 0 # zero sum -> draw
 
+    return evaluate_static(board)
 
-def evaluate(board: chess.Board, ply: int = 0) -> int:
+def evaluate_static(board: chess.Board) -> int:
     """
-    Evaluate the current board position.
+    Evaluate material and piece placement only, without checking whether
+    the game is over. For searches that already know the side to move has
+    legal moves.
     
     Args:
         board: chess.Board object
@@ -178,34 +211,46 @@ def evaluate(board: chess.Board, ply: int = 0) -> int:
     Returns:
         int: Score is in centipawns. (positive = white advantage, negative = black advantage)
     """
-    if board.is_stalemate() or board.is_insufficient_material():
-        return 0 # zero sum -> draw
-    
-    # Check for game ending condition
-    # Prefer faster mates by reducing the magnitude with ply distance
-    if board.is_checkmate():
-        mate_score = 20000 - ply
-        return -mate_score if board.turn == chess.WHITE else mate_score
-    
-    engame = is_endgame(board)
+    # Tuple of the board's bitboards, far cheaper to build than a zobrist hash
+    key = board._transposition_key()
+    score = _EVAL_CACHE.get(key)
+    if score is not None:
+        return score
+
+    # Read each bitboard once; everything below works on these locals
+    pawns, knights, bishops = board.pawns, board.knights, board.bishops
+    rooks, queens, kings = board.rooks, board.queens, board.kings
+    white, black = board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK]
+    pst = PST_FLAT
+
+    # Visit only occupied squares, one piece type and color at a time
     score = 0
-    
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        
-        if piece is not None:
-            # Material value
-            material_value = PIECE_VALUES[piece.piece_type]
-            
-            # Positional value
-            positional_value = get_piece_square_value(piece, square, endgame=engame)
-            
-            total_value = material_value + positional_value
-            
-            score += total_value if piece.color == chess.WHITE else -total_value
+    for piece_type, pieces in ((chess.PAWN, pawns), (chess.KNIGHT, knights), (chess.BISHOP, bishops),
+                               (chess.ROOK, rooks), (chess.QUEEN, queens), (chess.KING, kings)):
+        for color, side in ((chess.WHITE, white), (chess.BLACK, black)):
+            offset = (piece_type * 2 + color) * 128
+            for square in chess.scan_forward(pieces & side):
+                score += pst[offset + square]
 
+    # Same rule as is_endgame; only the king tables differ between phases
+    queen_count = chess.popcount(queens)
+    if queen_count == 0 or (queen_count == 1 and chess.popcount(rooks | bishops | knights) <= 4):
+        for color, side in ((chess.WHITE, white), (chess.BLACK, black)):
+            king_mask = kings & side
+            if king_mask:
+                king_square = chess.msb(king_mask)
+                score += (pst[pst_offset(chess.KING, color, True) + king_square]
+                          - pst[pst_offset(chess.KING, color, False) + king_square])
+
+    _cache_score(key, score)
     return score
 
+def _cache_score(key: Hashable, score: int) -> None:
+    """Store an evaluation, evicting the oldest entry if the cache is full."""
+    if len(_EVAL_CACHE) >= EVAL_CACHE_SIZE:
+        _EVAL_CACHE.popitem(last=False)
+    _EVAL_CACHE[key] = score
+
 def count_material(board: chess.Board) -> int:
     """
     Count material balance on the board.
@@ -216,19 +261,24 @@ def count_material(board: chess.Board) -> int:
     Returns:
         int: Material balance in centipawns.
     """
-    score = 0
-    
-    # Iterate through all squares on the board
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        
-        if piece is not None:
-            # Get the value
-            value = PIECE_VALUES[piece.piece_type]
-            # Add for white pieces, subtract for black pieces
-            score += value if piece.color == chess.WHITE else -value
+    return material_score(board.pawns, board.knights, board.bishops, board.rooks, board.queens,
+                          board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK])
+
+def material_score(pawns: int, knights: int, bishops: int, rooks: int, queens: int,
+                   white: int, black: int) -> int:
+    """
+    Material balance from raw bitboards: pure integer arithmetic with no
+    board access, so it can score positions stored as plain ints.
     
-    return score
+    Returns:
+        int: Material balance in centipawns.
+    """
+    # Kings are always one each and cancel out
+    return (_PT_VALUES[chess.PAWN] * (chess.popcount(pawns & white) - chess.popcount(pawns & black))
+            + _PT_VALUES[chess.KNIGHT] * (chess.popcount(knights & white) - chess.popcount(knights & black))
+            + _PT_VALUES[chess.BISHOP] * (chess.popcount(bishops & white) - chess.popcount(bishops & black))
+            + _PT_VALUES[chess.ROOK] * (chess.popcount(rooks & white) - chess.popcount(rooks & black))
+            + _PT_VALUES[chess.QUEEN] * (chess.popcount(queens & white) - chess.popcount(queens & black)))
 
 if __name__ == "__main__":
     # Test starting position
@@ -2,33 +2,34 @@
 
 import chess
 import chess.svg
+import re
 import sys
 import argparse
 from engine import find_best_move_alpha_beta
 from evaluation import evaluate
 from src.agents import MinimaxAgent, AlphaBetaAgent, ExpectimaxAgent, ValueIterationAgent, QLearningAgent
 
+# Moves in UCI notation, e.g. e2e4 or e7e8q (input is lowercased first)
+_UCI_RE = re.compile(r'^[a-h][1-8][a-h][1-8][qrbn]?$')
+
+# Interactive difficulty choice -> search depth
+DIFFICULTY_DEPTHS = {'1': 2, '2': 3, '3': 4, '4': 5}
+
 def print_board(board: chess.Board):
     """ Print the chess board in a readable format. """
-    print("\n" + "  a b c d e f g h")
-    print("  " + "-" * 16)
+    # Fill an 8x8 grid from the occupied squares only, top row = rank 8
+    rows = [["."] * 8 for _ in range(8)]
+    for square, piece in board.piece_map().items():
+        # white pieces uppercase, black pieces lowercase
+        rows[7 - chess.square_rank(square)][chess.square_file(square)] = piece.symbol()
     
-    # Print from rank 8 to rank 1 (top to bottom)
-    for rank in range(7, -1, -1):
-        row = f"{rank + 1}|"
-        for file in range(8):
-            square = chess.square(file, rank)
-            piece = board.piece_at(square)
-            
-            if piece is None:
-                row += ". "
-            else:
-                symbol = piece.symbol()
-                # white pieces uppercase, black pieces lowercase
-                row += f"{symbol} "
-        print(row + f"|{rank + 1}")
-    print("  " + "-" * 16)
-    print("  a b c d e f g h\n")
+    # Collect every line and write the board with a single print
+    files = "  a b c d e f g h"
+    border = "  " + "-" * 16
+    lines = ["", files, border]
+    lines.extend(f"{rank}|{' '.join(cells)} |{rank}" for rank, cells in zip(range(8, 0, -1), rows))
+    lines += [border, files + "\n"]
+    print("\n".join(lines))
     
 def get_human_move(board: chess.Board) -> chess.Move:
     """
@@ -40,6 +41,10 @@ def get_human_move(board: chess.Board) -> chess.Move:
     Returns:
         chess.Move: the move entered by the human
     """
+    # Generated once for the whole prompt
+    legal_moves = list(board.legal_moves)
+    legal_set = set(legal_moves)
+
     while True:
         print("Enter your move (e.g., e2e4 or e4 for pawn move)")
         print("Type 'moves' for legal moves, 'quit' to exit, 'help' for commands.")
@@ -62,7 +67,7 @@ def get_human_move(board: chess.Board) -> chess.Move:
         
         if user_input == 'moves':
             print("\nLegal moves:")
-            moves_list = [board.san(move) for move in board.legal_moves]
+            moves_list = [board.san(move) for move in legal_moves]
             # print in columns
             for i in range(0, len(moves_list), 6):
                 print("  " + ", ".join(moves_list[i:i+6]))
@@ -82,14 +87,14 @@ def get_human_move(board: chess.Board) -> chess.Move:
             
         try:
             # Try UCI format first
-            if len(user_input) in [4, 5] and user_input[0] in 'abcdefgh' and user_input[2] in 'abcdefgh': # e2e4 or e7e8q
+            if _UCI_RE.match(user_input):
                 move = chess.Move.from_uci(user_input)
             else:
                 # Try SAN format
                 move = board.parse_san(user_input)
             
             # check if move is legal
-            if move in board.legal_moves:
+            if move in legal_set:
                 return move
             else:
                 print("Illegal move. Try again.")
@@ -148,9 +153,8 @@ def play_game(agent_name="alphabeta", ai_depth=3):
             if human_move == "UNDO":
                 print_board(board)
                 continue
-            move_san = board.san(human_move)
             board.push(human_move)
-            print(f"You played: {move_san}")
+            print(f"You played: {human_move.uci()}")
         else:
             print(f"Move {move_number}. AI's turn (Black). Thinking...")
             import time
@@ -161,9 +165,8 @@ def play_game(agent_name="alphabeta", ai_depth=3):
             if ai_move is None:
                 print("AI resigns. You win!")
                 break
-            move_san = board.san(ai_move)
             board.push(ai_move)
-            print(f"AI played: {move_san}")
+            print(f"AI played: {ai_move.uci()}")
             
             # Show AI stats
             stats = ai_agent.get_search_info()
@@ -220,8 +223,8 @@ def main():
         
         while True:
             difficulty = input("> ").strip()
-            if difficulty in ['1', '2', '3', '4']:
-                depth = int(difficulty) + 1
+            if difficulty in DIFFICULTY_DEPTHS:
+                depth = DIFFICULTY_DEPTHS[difficulty]
                 break
             else:
                 print("Invalid choice. Please enter 1, 2, 3, or 4.")
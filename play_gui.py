@@ -10,10 +10,6 @@ project_root = Path(__file__).resolve().parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.gui import ChessGUI, play_game_with_gui, watch_agents_play
-from src.agents import HumanAgent, MinimaxAgent, AlphaBetaAgent, ExpectimaxAgent
-from evaluation import evaluate
-
 
 def main():
     parser = argparse.ArgumentParser(description="Play chess with GUI")
@@ -56,15 +52,22 @@ def main():
     )
     
     args = parser.parse_args()
+    # Imported after argument parsing so --help does not load tkinter or the agents
+    from src.gui import play_game_with_gui, watch_agents_play
+    from evaluation import evaluate
+
     # Create agents (None means human player, handled by GUI)
     def create_agent(agent_type, color):
         if agent_type == "human":
             return None  # GUI handles human input
         elif agent_type == "minimax":
+            from src.agents import MinimaxAgent
             return MinimaxAgent(evaluate, depth=args.depth, name="Minimax", color=color)
         elif agent_type == "alphabeta":
+            from src.agents import AlphaBetaAgent
             return AlphaBetaAgent(evaluate, depth=args.depth, name="AlphaBeta", color=color)
         elif agent_type == "expectimax":
+            from src.agents import ExpectimaxAgent
             return ExpectimaxAgent(evaluate, depth=args.depth, name="Expectimax", color=color)
         return None
     
@@ -14,17 +14,6 @@ project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.agents import (
-    MinimaxAgent,
-    AlphaBetaAgent,
-    ExpectimaxAgent,
-    RandomAgent,
-    SimpleAgent,
-    QLearningAgent,
-    ValueIterationAgent,
-)
-from src.evaluation import evaluate
-
 
 def create_agent(agent_key: str, color: chess.Color, *, depth: int = 3, vi_iterations: int = 3, q_numTraining: int = 0, q_epsilon: float = 0.0):
     """Create an agent instance from a short key.
@@ -32,31 +21,53 @@ def create_agent(agent_key: str, color: chess.Color, *, depth: int = 3, vi_itera
     Parameters are provided with sane defaults for fast tests.
     """
     key = agent_key.lower()
+    # Agents are imported on demand so scripts only load what they use
     if key == "minimax":
+        from src.agents import MinimaxAgent
+        from src.evaluation import evaluate
         return MinimaxAgent(evaluate, depth=depth, name="Minimax", color=color)
     if key == "alphabeta":
+        from src.agents import AlphaBetaAgent
+        from src.evaluation import evaluate
         return AlphaBetaAgent(evaluate, depth=depth, name="AlphaBeta", color=color)
     if key == "expectimax":
+        from src.agents import ExpectimaxAgent
+        from src.evaluation import evaluate
         return ExpectimaxAgent(evaluate, depth=depth, name="Expectimax", color=color)
     if key == "random":
+        from src.agents import RandomAgent
         return RandomAgent(name="Random", color=color)
     if key == "simple":
+        from src.agents import SimpleAgent
         return SimpleAgent(name="Simple", color=color)
     if key == "qlearning":
+        from src.agents import QLearningAgent
         return QLearningAgent(name="QLearning", color=color, numTraining=q_numTraining, epsilon=q_epsilon)
     if key == "valueiteration":
+        from src.agents import ValueIterationAgent
         return ValueIterationAgent(discount=0.9, iterations=vi_iterations, name="ValueIteration", color=color)
 
     raise RuntimeError(f"Unknown agent type '{agent_key}'")
 
 
-def play_game(white_agent, black_agent, timeout_seconds: int = 120):
-    """Play one game between two agents. Returns outcome string: 'white','black','draw','timeout','error'."""
-    board = chess.Board()
-    start_time = time.time()
+def play_game(white_agent, black_agent, timeout_seconds: int = 120, board: chess.Board = None):
+    """Play one game between two agents. Returns outcome string: 'white','black','draw','timeout','error'.
+
+    Pass `board` to reuse one Board across games; it is reset to the
+    starting position first.
+    """
+    if board is None:
+        board = chess.Board()
+    else:
+        board.reset()
+    start = time.perf_counter_ns()
+    timeout_ns = int(timeout_seconds * 1_000_000_000)
 
-    while not board.is_game_over():
-        if time.time() - start_time > timeout_seconds:
+    # outcome() runs the game-over tests once per ply and also says who won,
+    # so the result needs no second checkmate test. Draws are never claimed.
+    outcome = board.outcome(claim_draw=False)
+    while outcome is None:
+        if time.perf_counter_ns() - start > timeout_ns:
             return "timeout"
 
         current = white_agent if board.turn == chess.WHITE else black_agent
@@ -64,15 +75,16 @@ def play_game(white_agent, black_agent, timeout_seconds: int = 120):
         if move is None:
             return "error"
         board.push(move)
+        outcome = board.outcome(claim_draw=False)
 
-    if board.is_checkmate():
-        return "white" if board.turn == chess.BLACK else "black"
-    return "draw"
+    if outcome.winner is None:
+        return "draw"
+    return "white" if outcome.winner == chess.WHITE else "black"
 
 
-def play_single_game_with_stats(white_agent, black_agent, timeout_seconds: int = 120):
+def play_single_game_with_stats(white_agent, black_agent, timeout_seconds: int = 120, board: chess.Board = None):
     """Play a game and return (result, white_avg_time, black_avg_time)."""
-    result = play_game(white_agent, black_agent, timeout_seconds)
+    result = play_game(white_agent, black_agent, timeout_seconds, board)
     white_avg = white_agent.total_time / white_agent.moves_made if white_agent.moves_made else 0
     black_avg = black_agent.total_time / black_agent.moves_made if black_agent.moves_made else 0
     return result, white_avg, black_avg
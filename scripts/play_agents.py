@@ -1,27 +1,39 @@
 """Run automated matches between two agents (agent vs agent)."""
 
+from __future__ import annotations
+
 import argparse
 import chess
+import os
+import random
 import time
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.agents.base_agent import BaseAgent
 from scripts.agent_utils import create_agent, play_game as play_game_simple, play_single_game_with_stats
 
+if TYPE_CHECKING:
+    from src.agents.base_agent import BaseAgent
+
 
-def play_single_game(white_agent: BaseAgent, black_agent: BaseAgent, timeout_seconds: int = 600):
-    return play_game_simple(white_agent, black_agent, timeout_seconds)
+def play_single_game(white_agent: BaseAgent, black_agent: BaseAgent, timeout_seconds: int = 600, board: chess.Board = None):
+    return play_game_simple(white_agent, black_agent, timeout_seconds, board)
 
 
 def make_agents_play(white_agent: BaseAgent, black_agent: BaseAgent, iterations: int):
     results = {"white": 0, "black": 0, "draw": 0, "timeout": 0, "error": 0}
-    w_times = []
-    b_times = []
+    # Running totals for the mean move times, so no per-game list is kept
+    games = 0
+    w_total = 0.0
+    b_total = 0.0
+    # One board for the whole match, reset at the start of each game
+    board = chess.Board()
 
     for i in range(1, iterations + 1):
         print(f"\n=== Game {i}/{iterations} ===")
@@ -29,10 +41,11 @@ def make_agents_play(white_agent: BaseAgent, black_agent: BaseAgent, iterations:
         white_agent.reset_stats()
         black_agent.reset_stats()
 
-        result, w_avg, b_avg = play_single_game_with_stats(white_agent, black_agent)
+        result, w_avg, b_avg = play_single_game_with_stats(white_agent, black_agent, board=board)
         results[result] = results.get(result, 0) + 1
-        w_times.append(w_avg)
-        b_times.append(b_avg)
+        games += 1
+        w_total += w_avg
+        b_total += b_avg
 
         print(f"Result: {result}")
         print(f"  White ({white_agent}): avg move time {w_avg:.4f}s")
@@ -41,10 +54,81 @@ def make_agents_play(white_agent: BaseAgent, black_agent: BaseAgent, iterations:
 
     print("\n=== Summary ===")
     print(results)
-    if w_times:
-        print(f"White mean move time: {sum(w_times)/len(w_times):.4f}s")
-    if b_times:
-        print(f"Black mean move time: {sum(b_times)/len(b_times):.4f}s")
+    if games:
+        print(f"White mean move time: {w_total/games:.4f}s")
+        print(f"Black mean move time: {b_total/games:.4f}s")
+
+
+# Agents built inside a pool worker, keyed by (agent_key, color, kwargs), so a
+# worker constructs (and trains) each agent once however many games it plays
+_worker_agents = {}
+# Board reused by every game a worker plays
+_worker_board = chess.Board()
+
+
+def _worker_agent(spec):
+    agent_key, color, kwargs = spec
+    cache_key = (agent_key, color, tuple(sorted(kwargs.items())))
+    agent = _worker_agents.get(cache_key)
+    if agent is None:
+        agent = create_agent(agent_key, color, **kwargs)
+        _worker_agents[cache_key] = agent
+    return agent
+
+
+def _play_one(job):
+    """Pool worker: rebuild both agents from their specs and play one game."""
+    game_idx, white_spec, black_spec = job
+    # Distinct seed per game so randomized agents do not replay identical games
+    random.seed(game_idx)
+    white_agent = _worker_agent(white_spec)
+    black_agent = _worker_agent(black_spec)
+    # Agents with their own generator are reseeded too, one stream per side
+    for side, agent in enumerate((black_agent, white_agent)):
+        rng = getattr(agent, "_rng", None)
+        if rng is not None:
+            rng.seed(2 * game_idx + side)
+    white_agent.reset_stats()
+    black_agent.reset_stats()
+    result, w_avg, b_avg = play_single_game_with_stats(white_agent, black_agent, board=_worker_board)
+    return game_idx, result, w_avg, b_avg, str(white_agent), str(black_agent)
+
+
+def make_agents_play_parallel(white_spec, black_spec, iterations: int, processes: int = None):
+    """Play `iterations` games across a process pool.
+
+    Agents are described by picklable `(agent_key, color, kwargs)` specs and
+    constructed inside each worker via `create_agent`. Returns the result counts.
+    """
+    results = {"white": 0, "black": 0, "draw": 0, "timeout": 0, "error": 0}
+    # Running totals for the mean move times, so no per-game list is kept
+    games = 0
+    w_total = 0.0
+    b_total = 0.0
+
+    jobs = [(i, white_spec, black_spec) for i in range(1, iterations + 1)]
+    # ProcessPoolExecutor workers are not daemonic, so agents built inside
+    # them (ValueIterationAgent) can start their own process pools
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+        futures = [executor.submit(_play_one, job) for job in jobs]
+        for future in as_completed(futures):
+            i, result, w_avg, b_avg, white_name, black_name = future.result()
+            results[result] = results.get(result, 0) + 1
+            games += 1
+            w_total += w_avg
+            b_total += b_avg
+
+            print(f"\n=== Game {i}/{iterations} ===")
+            print(f"Result: {result}")
+            print(f"  White ({white_name}): avg move time {w_avg:.4f}s")
+            print(f"  Black ({black_name}): avg move time {b_avg:.4f}s")
+
+    print("\n=== Summary ===")
+    print(results)
+    if games:
+        print(f"White mean move time: {w_total/games:.4f}s")
+        print(f"Black mean move time: {b_total/games:.4f}s")
+    return results
 
 
 def create_agent_from_key(agent_key: str, color: chess.Color, *, depth: int = 3, vi_iterations: int = 3, q_numTraining: int = 0, q_epsilon: float = 0.0):
@@ -63,11 +147,20 @@ def main():
     parser.add_argument("--vi-iterations", type=int, default=3, help="Iterations for ValueIterationAgent")
     parser.add_argument("--q-train", type=int, default=0, help="Number of training episodes for QLearningAgent before matches")
     parser.add_argument("--q-epsilon", type=float, default=0.0, help="Exploration epsilon for QLearningAgent during matches")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes to play games in parallel (0 = one per CPU)")
     args = parser.parse_args()
 
     depth_white = args.white_depth if args.white_depth is not None else args.depth
     depth_black = args.black_depth if args.black_depth is not None else args.depth
 
+    if args.processes != 1:
+        common = dict(vi_iterations=args.vi_iterations, q_numTraining=args.q_train, q_epsilon=args.q_epsilon)
+        white_spec = (args.white_agent, chess.WHITE, dict(common, depth=depth_white))
+        black_spec = (args.black_agent, chess.BLACK, dict(common, depth=depth_black))
+        print(f"Playing {args.num_games} games: White={args.white_agent}, Black={args.black_agent}")
+        make_agents_play_parallel(white_spec, black_spec, iterations=args.num_games, processes=args.processes or None)
+        return
+
     white = create_agent_from_key(args.white_agent, chess.WHITE, depth=depth_white, vi_iterations=args.vi_iterations, q_numTraining=args.q_train, q_epsilon=args.q_epsilon)
     black = create_agent_from_key(args.black_agent, chess.BLACK, depth=depth_black, vi_iterations=args.vi_iterations, q_numTraining=args.q_train, q_epsilon=args.q_epsilon)
 
@@ -13,6 +13,25 @@ from src.agents import HumanAgent
 from src.agents import AlphaBetaAgent, MinimaxAgent, ExpectimaxAgent, RandomAgent, SimpleAgent, QLearningAgent, ValueIterationAgent
 from src.evaluation import evaluate
 
+# Menu choice -> (search depth, difficulty name)
+DIFFICULTY_MAP = {
+    '1': (2, 'Easy'),
+    '2': (3, 'Medium'),
+    '3': (4, 'Hard'),
+    '4': (5, 'Expert')
+}
+
+# Menu choice -> agent type
+AGENT_MAP = {
+    '1': 'minimax',
+    '2': 'alphabeta',
+    '3': 'expectimax',
+    '4': 'random',
+    '5': 'simple',
+    '6': 'qlearning',
+    '7': 'valueiteration'
+}
+
 
 def print_board(board: chess.Board) -> None:
     """
@@ -21,25 +40,19 @@ def print_board(board: chess.Board) -> None:
     Args:
         board: Current chess board state
     """
-    print("\n" + "  a b c d e f g h")
-    print("  " + "-" * 16)
+    # Fill an 8x8 grid from the occupied squares only, top row = rank 8
+    rows = [["."] * 8 for _ in range(8)]
+    for square, piece in board.piece_map().items():
+        # white pieces uppercase, black pieces lowercase
+        rows[7 - chess.square_rank(square)][chess.square_file(square)] = piece.symbol()
     
-    # Print from rank 8 to rank 1 (top to bottom)
-    for rank in range(7, -1, -1):
-        row = f"{rank + 1}|"
-        for file in range(8):
-            square = chess.square(file, rank)
-            piece = board.piece_at(square)
-            
-            if piece is None:
-                row += ". "
-            else:
-                symbol = piece.symbol()
-                row += f"{symbol} "
-        print(row + f"|{rank + 1}")
-    
-    print("  " + "-" * 16)
-    print("  a b c d e f g h\n")
+    # Collect every line and write the board with a single print
+    files = "  a b c d e f g h"
+    border = "  " + "-" * 16
+    lines = ["", files, border]
+    lines.extend(f"{rank}|{' '.join(cells)} |{rank}" for rank, cells in zip(range(8, 0, -1), rows))
+    lines += [border, files + "\n"]
+    print("\n".join(lines))
 
 
 def print_game_result(board: chess.Board, white_agent, black_agent) -> None:
@@ -107,19 +120,10 @@ def get_agent_choice() -> str:
     print("  5. Simple Heuristic")
     print("  6. Q-Learning")
     print("  7. Value Iteration")
-    agent_map = {
-        '1': 'minimax',
-        '2': 'alphabeta',
-        '3': 'expectimax',
-        '4': 'random',
-        '5': 'simple',
-        '6': 'qlearning',
-        '7': 'valueiteration'
-    }
     while True:
         choice = input("> ").strip()
-        if choice in agent_map:
-            return agent_map[choice]
+        if choice in AGENT_MAP:
+            return AGENT_MAP[choice]
         print("Invalid choice. Please enter a number from 1 to 7.")
 
 def get_difficulty_settings() -> tuple[int, str]:
@@ -135,17 +139,10 @@ def get_difficulty_settings() -> tuple[int, str]:
     print("  3. Hard   (depth 4)")
     print("  4. Expert (depth 5)")
     
-    difficulty_map = {
-        '1': (2, 'Easy'),
-        '2': (3, 'Medium'),
-        '3': (4, 'Hard'),
-        '4': (5, 'Expert')
-    }
-    
     while True:
         choice = input("> ").strip()
-        if choice in difficulty_map:
-            depth, name = difficulty_map[choice]
+        if choice in DIFFICULTY_MAP:
+            depth, name = DIFFICULTY_MAP[choice]
             return depth, name
         print("Invalid choice. Please enter 1, 2, 3, or 4.")
 
@@ -253,9 +250,8 @@ def play_game():
             if move == "UNDO":
                 continue
             
-            move_str = board.san(move)
             board.push(move)
-            print(f"→ {current_agent.name} played: {move_str}\n")
+            print(f"→ {current_agent.name} played: {move.uci()}\n")
         
         else:
             # AI's turn
@@ -276,10 +272,9 @@ def play_game():
             if isinstance(search_info, dict):
                 nodes_searched = search_info.get('nodes_searched', 0)
 
-            move_str = board.san(move)
             board.push(move)
 
-            print(f"\r→ {current_agent.name} played: {move_str}")
+            print(f"\r→ {current_agent.name} played: {move.uci()}")
             print(f"  (searched {nodes_searched:,} nodes in {elapsed:.2f}s)")
             print()
             
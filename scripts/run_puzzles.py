@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 import chess
@@ -26,6 +27,45 @@ from src.agents import MinimaxAgent, AlphaBetaAgent, ExpectimaxAgent, QLearningA
 from src.evaluation import evaluate
 
 
+def build_agent(agent_type: str, depth: int):
+    """Construct the agent for an --agents key, or None if the key has no agent."""
+    if agent_type == "minimax":
+        return MinimaxAgent(
+            evaluate, 
+            depth=depth, 
+            name=f"Minimax-d{depth}",
+        )
+    elif agent_type == "alphabeta":
+        return AlphaBetaAgent(
+            evaluate,
+            depth=depth,
+            name=f"AlphaBeta-d{depth}",
+        )
+    elif agent_type == "expectimax":
+        return ExpectimaxAgent(
+            evaluate,
+            depth=depth,
+            name=f"Expectimax-d{depth}"
+        )
+    elif agent_type == "qlearning":
+        return QLearningAgent(
+            name="QLearning",
+            color=chess.BLACK
+        )
+    elif agent_type == "valueiteration":
+        return ValueIterationAgent(
+            discount=0.9,
+            iterations=3,
+            name="ValueIteration",
+            color=chess.BLACK
+        )
+    return None
+
+
+# Keys build_agent knows how to construct
+BUILDABLE_AGENTS = ("minimax", "alphabeta", "expectimax", "qlearning", "valueiteration")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Evaluate chess agents on Lichess puzzles",
@@ -91,6 +131,12 @@ Examples:
         default=["alphabeta", "expectimax"],
         help="Agents to evaluate (default: alphabeta expectimax)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to solve puzzles in parallel (0 = one per CPU, default: 1)"
+    )
 
     # Output options
     parser.add_argument(
@@ -161,45 +207,21 @@ Examples:
     if "all" in agent_types:
         agent_types = ["minimax", "alphabeta", "expectimax", "qlearning", "valueiteration", "random"]
     
-    agents = []
-    for agent_type in agent_types:
-        if agent_type == "minimax":
-            agents.append(MinimaxAgent(
-                evaluate, 
-                depth=args.depth, 
-                name=f"Minimax-d{args.depth}",
-            ))
-        elif agent_type == "alphabeta":
-            agents.append(AlphaBetaAgent(
-                evaluate,
-                depth=args.depth,
-                name=f"AlphaBeta-d{args.depth}",
-            ))
-        elif agent_type == "expectimax":
-            agents.append(ExpectimaxAgent(
-                evaluate,
-                depth=args.depth,
-                name=f"Expectimax-d{args.depth}"
-            ))
-        elif agent_type == "qlearning":
-            agents.append(QLearningAgent(
-                name="QLearning",
-                color=chess.BLACK
-            ))
-        elif agent_type == "valueiteration":
-            agents.append(ValueIterationAgent(
-                discount=0.9,
-                iterations=3,
-                name="ValueIteration",
-                color=chess.BLACK
-            ))
-        
-    print(f"\nAgents to test: {', '.join(a.name for a in agents)}")
-    
-
-    # evaluate w puzzle evaluator from Van
     evaluator = PuzzleEvaluator(verbose=args.verbose)
-    reports = evaluator.compare_agents(agents, puzzles, depth=args.depth)
+    if args.workers != 1:
+        # Workers build their own agents from these picklable factories
+        factories = [functools.partial(build_agent, agent_type, args.depth)
+                     for agent_type in agent_types if agent_type in BUILDABLE_AGENTS]
+        print(f"\nSolving on {args.workers or 'all'} worker processes")
+        reports = evaluator.compare_agents_parallel(factories, puzzles, depth=args.depth,
+                                                    workers=args.workers or None)
+    else:
+        agents = [build_agent(agent_type, args.depth) for agent_type in agent_types]
+        agents = [agent for agent in agents if agent is not None]
+        print(f"\nAgents to test: {', '.join(a.name for a in agents)}")
+
+        # evaluate w puzzle evaluator from Van
+        reports = evaluator.compare_agents(agents, puzzles, depth=args.depth)
     
 
     # Some analysis for the report 
@@ -9,6 +9,8 @@ Usage examples:
 """
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
 import chess
@@ -48,7 +50,32 @@ def update_elo(r_a: float, r_b: float, score_a: float, k: float) -> tuple[float,
 # use shared play_game from scripts.agent_utils
 
 
-def run_tournament(agent_keys, games_per_pair=2, k=20, *, depth=2, q_numTraining=0, q_epsilon=0.0, vi_iterations=3, depths_map=None):
+# Agents keyed by (agent_key, color, depth, kwargs). Each process builds (and
+# trains) an agent once and reuses it for every game it plays; search agents
+# keep their transposition tables between games
+_agent_cache = {}
+
+
+def _cached_agent(agent_key, color, depth, agent_kwargs):
+    cache_key = (agent_key, color, depth, tuple(sorted(agent_kwargs.items())))
+    agent = _agent_cache.get(cache_key)
+    if agent is None:
+        agent = create_agent(agent_key, color, depth=depth, **agent_kwargs)
+        _agent_cache[cache_key] = agent
+    return agent
+
+
+def _play_one(task):
+    """Fetch both agents for one tournament game, play it and return the result."""
+    white_key, black_key, depth_w, depth_b, agent_kwargs = task
+    white = _cached_agent(white_key, chess.WHITE, depth_w, agent_kwargs)
+    black = _cached_agent(black_key, chess.BLACK, depth_b, agent_kwargs)
+    white.reset_stats()
+    black.reset_stats()
+    return play_game(white, black)
+
+
+def run_tournament(agent_keys, games_per_pair=2, k=20, *, depth=2, q_numTraining=0, q_epsilon=0.0, vi_iterations=3, depths_map=None, processes=1):
     # initialize ratings
     ratings = {k: 1200.0 for k in agent_keys}
     records = {k: {"wins": 0, "losses": 0, "draws": 0} for k in agent_keys}
@@ -59,18 +86,33 @@ def run_tournament(agent_keys, games_per_pair=2, k=20, *, depth=2, q_numTraining
         for j in range(i + 1, len(agent_keys)):
             pairs.append((agent_keys[i], agent_keys[j]))
 
+    agent_kwargs = dict(vi_iterations=vi_iterations, q_numTraining=q_numTraining, q_epsilon=q_epsilon)
+    games = []
     for a, b in pairs:
-        print(f"\n=== Match: {a} vs {b} ({games_per_pair} games) ===")
         for game_idx in range(games_per_pair):
             # alternate colors each game
             white_key, black_key = (a, b) if game_idx % 2 == 0 else (b, a)
             depth_w = depths_map.get(white_key, depth) if depths_map else depth
             depth_b = depths_map.get(black_key, depth) if depths_map else depth
-
-            white = create_agent(white_key, chess.WHITE, depth=depth_w, vi_iterations=vi_iterations, q_numTraining=q_numTraining, q_epsilon=q_epsilon)
-            black = create_agent(black_key, chess.BLACK, depth=depth_b, vi_iterations=vi_iterations, q_numTraining=q_numTraining, q_epsilon=q_epsilon)
-
-            result = play_game(white, black)
+            games.append((a, b, game_idx, (white_key, black_key, depth_w, depth_b, agent_kwargs)))
+    tasks = [task for _, _, _, task in games]
+
+    # Games are independent, so they can be played across a process pool;
+    # map keeps task order, so the Elo updates below run in the same order
+    # (and give the same ratings) as a serial tournament. ProcessPoolExecutor
+    # workers are not daemonic, so agents built inside them
+    # (ValueIterationAgent) can start their own process pools
+    executor = None
+    if processes != 1:
+        executor = ProcessPoolExecutor(max_workers=processes or os.cpu_count())
+        results = executor.map(_play_one, tasks)
+    else:
+        results = map(_play_one, tasks)
+
+    try:
+        for (a, b, game_idx, (white_key, black_key, _, _, _)), result in zip(games, results):
+            if game_idx == 0:
+                print(f"\n=== Match: {a} vs {b} ({games_per_pair} games) ===")
 
             if result == "white":
                 winner = white_key
@@ -117,6 +159,16 @@ def run_tournament(agent_keys, games_per_pair=2, k=20, *, depth=2, q_numTraining
 
             print(f"Game {game_idx+1}: {white_key}(White) vs {black_key}(Black) -> {result}")
             print(f" Updated Elo: {a}: {ratings[a]:.1f}, {b}: {ratings[b]:.1f}")
+    except BaseException:
+        # On an error or Ctrl-C, drop the queued games instead of waiting
+        # for all of them
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = None
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     # final standings
     standings = sorted(ratings.items(), key=lambda x: x[1], reverse=True)
@@ -124,6 +176,7 @@ def run_tournament(agent_keys, games_per_pair=2, k=20, *, depth=2, q_numTraining
     for key, r in standings:
         rec = records[key]
         print(f"{key}: {r:.1f}  (W:{rec['wins']} L:{rec['losses']} D:{rec['draws']})")
+    return ratings, records
 
 
 def parse_args():
@@ -135,6 +188,7 @@ def parse_args():
     parser.add_argument("--vi-iterations", type=int, default=3, help="Iterations for ValueIterationAgent")
     parser.add_argument("--q-train", type=int, default=0, help="Number of training episodes for QLearningAgent before matches")
     parser.add_argument("--q-epsilon", type=float, default=0.0, help="Exploration epsilon for QLearningAgent during matches")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes to play games in parallel (0 = one per CPU)")
     parser.add_argument("--depths", type=str, default=None, help="Optional comma-separated list of agent:depth to override default depth (e.g. minimax:3,alphabeta:2)")
     return parser.parse_args()
 
@@ -167,6 +221,7 @@ def main():
         q_epsilon=args.q_epsilon,
         vi_iterations=args.vi_iterations,
         depths_map=depths_map,
+        processes=args.processes,
     )
 
 
@@ -1,6 +1,7 @@
 """Base class for chess agents."""
 
 from abc import ABC, abstractmethod
+import random
 import time
 import chess
 from typing import Optional, Dict, Any
@@ -18,7 +19,8 @@ class BaseAgent(ABC):
         color: Chess color the agent plays (WHITE or BLACK)
         moves_made: Number of moves this agent has made
         nodes_searched: Total nodes searched (for search-based agents)
-        total_time: Total computation time in seconds
+        total_time: Total computation time in seconds (derived from total_time_ns)
+        total_time_ns: Total computation time in nanoseconds
     
     Example:
         >>> class RandomAgent(BaseAgent):
@@ -31,6 +33,10 @@ class BaseAgent(ABC):
         >>> move = agent.choose_move(board, time_limit=5.0)
     """
     
+    # Statistics are updated on every move; slots make those writes cheaper.
+    # Subclasses that do not declare __slots__ still get an instance __dict__.
+    __slots__ = ("name", "color", "moves_made", "nodes_searched", "total_time_ns")
+    
     def __init__(
         self, 
         name: str = "BaseAgent", 
@@ -49,7 +55,12 @@ class BaseAgent(ABC):
         # Statistics
         self.moves_made = 0
         self.nodes_searched = 0
-        self.total_time = 0.0
+        self.total_time_ns = 0
+    
+    @property
+    def total_time(self) -> float:
+        """Total computation time in seconds."""
+        return self.total_time_ns / 1e9
     
     @abstractmethod
     def choose_move(
@@ -88,16 +99,18 @@ class BaseAgent(ABC):
         Returns:
             The chosen move, or None if no legal moves available
         """
-        start_time = time.time()
+        # Monotonic integer clock; converted to seconds only when read
+        now = time.perf_counter_ns
+        start_time = now()
         
         move = self.choose_move(board)
         
-        elapsed = time.time() - start_time
+        elapsed = now() - start_time
         
         # Update statistics
         if move is not None:
             self.moves_made += 1
-            self.total_time += elapsed
+            self.total_time_ns += elapsed
         
         return move
     
@@ -115,7 +128,8 @@ class BaseAgent(ABC):
             - avg_time_per_move: Average time per move
             - avg_nodes_per_move: Average nodes per move
         """
-        avg_time = self.total_time / self.moves_made if self.moves_made > 0 else 0.0
+        total_time = self.total_time
+        avg_time = total_time / self.moves_made if self.moves_made > 0 else 0.0
         avg_nodes = self.nodes_searched / self.moves_made if self.moves_made > 0 else 0.0
         
         return {
@@ -123,7 +137,7 @@ class BaseAgent(ABC):
             "color": "White" if self.color == chess.WHITE else "Black",
             "moves_made": self.moves_made,
             "nodes_searched": self.nodes_searched,
-            "total_time": round(self.total_time, 3),
+            "total_time": round(total_time, 3),
             "avg_time_per_move": round(avg_time, 3),
             "avg_nodes_per_move": round(avg_nodes, 1),
         }
@@ -132,7 +146,13 @@ class BaseAgent(ABC):
         """Reset all performance statistics."""
         self.moves_made = 0
         self.nodes_searched = 0
-        self.total_time = 0.0
+        self.total_time_ns = 0
+    
+    def startEpisode(self) -> None:
+        """Called at the start of a training episode; no-op unless the agent learns."""
+    
+    def stopEpisode(self) -> None:
+        """Called at the end of a training episode; no-op unless the agent learns."""
     
     def __str__(self) -> str:
         """String representation of the agent."""
@@ -147,14 +167,23 @@ class BaseAgent(ABC):
 class RandomAgent(BaseAgent):
     """Agent that selects moves randomly."""
     
-    def __init__(self, name: str = "RandomAgent", color: chess.Color = chess.BLACK):
+    __slots__ = ("_rng",)
+    
+    def __init__(
+        self,
+        name: str = "RandomAgent",
+        color: chess.Color = chess.BLACK,
+        seed: Optional[int] = None
+    ):
         """Initialize Random agent.
         
         Args:
             name: Agent name
             color: Color the agent plays
+            seed: Seed for the agent's own random generator
         """
         super().__init__(name, color)
+        self._rng = random.Random(seed)
     
     def choose_move(self, board: chess.Board) -> Optional[chess.Move]:
         """Choose a random legal move.
@@ -165,17 +194,17 @@ class RandomAgent(BaseAgent):
         Returns:
             The chosen move, or None if no legal moves available
         """
-        import random
-        
         legal_moves = list(board.legal_moves)
         if not legal_moves:
             return None
         
-        return random.choice(legal_moves)
+        return self._rng.choice(legal_moves)
 
 class SimpleAgent(BaseAgent):
     """Agent that selects the first legal move available."""
     
+    __slots__ = ()
+    
     def __init__(self, name: str = "SimpleAgent", color: chess.Color = chess.BLACK):
         """Initialize Simple agent.
         
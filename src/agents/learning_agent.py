@@ -66,6 +66,7 @@ class ReinforcementAgent(ValueEstimationAgent):
           Start training episode
         """
         self.lastState = None
+        self.lastStateEval = None
         self.lastAction = None
         self.episodeRewards = 0.0
 
@@ -2,17 +2,44 @@
 
 from .learning_agent import ReinforcementAgent
 from collections import defaultdict
+import multiprocessing
 import random
 import chess
-from utils import flipCoin
+import chess.polyglot
+from typing import Iterable, Optional
 from evaluation import evaluate
+from ..search import HashedBoard
 
 class QLearningAgent(ReinforcementAgent):
     """Q-Learning Agent."""
-    def __init__(self, **args):
+    def __init__(self, workers: int = 1, seed: Optional[int] = None,
+                 checkpoint_episodes: Iterable[int] = (), **args):
+        """
+        Args:
+            workers: Number of processes to split the training episodes
+                across; their Q-tables are averaged afterwards
+            seed: Seed for the agent's own random generator, which drives
+                exploration, tie-breaks and the training opponent
+            checkpoint_episodes: Episode counts after which to snapshot the
+                Q-table into self.checkpoints (single-process training only)
+        """
         ReinforcementAgent.__init__(self, **args)
+        self._rng = random.Random(seed)
         self.q_values = defaultdict(float)
-        self.train()
+        # Zobrist keys of the states that have at least one Q-value; every
+        # other state values all its moves at 0
+        self._learned_states = set()
+        # Legal moves of the last position asked about; the opponent's reply
+        # and the next update look at the same position back to back. The
+        # list is refilled in place rather than reallocated per position.
+        self._legal_key = None
+        self._legal_moves = []
+        # Episode count -> copy of the Q-table after that many episodes
+        self.checkpoints = {}
+        if workers > 1 and self.numTraining > 1:
+            self.train_parallel(workers)
+        else:
+            self.train(checkpoint_episodes)
 
     def choose_move(self, board: chess.Board) -> chess.Move:
         """
@@ -26,6 +53,49 @@ class QLearningAgent(ReinforcementAgent):
         """
         return self.computeActionFromQValues(board)
 
+    def _legal(self, board: chess.Board) -> list:
+        """
+        Returns the legal moves for a board, reusing the last result if the
+        board is in the same position.
+
+        The list is shared and overwritten by the next call for another
+        position, so callers must not keep it.
+
+        Args:
+            board: The board to generate moves for
+        """
+        key = board._transposition_key()
+        if key != self._legal_key:
+            self._legal_key = key
+            moves = self._legal_moves
+            moves.clear()
+            moves.extend(board.generate_legal_moves())
+        return self._legal_moves
+
+    def _zobrist(self, board: chess.Board) -> int:
+        """
+        Returns the Zobrist key of a state.
+
+        Args:
+            board: The state
+        """
+        # Training boards keep their Zobrist key up to date move by move
+        return board.zobrist_key if isinstance(board, HashedBoard) else chess.polyglot.zobrist_hash(board)
+
+    def _key(self, zobrist: int, action: chess.Move) -> int:
+        """
+        Returns the q_values key for a state and action: the state's Zobrist
+        key with the move's squares and promotion packed into the low bits.
+
+        A single int hashes and compares faster than a tuple and takes less
+        memory per entry.
+
+        Args:
+            zobrist: Zobrist key of the state
+            action: The move taken from the state
+        """
+        return (zobrist << 15) | (action.from_square << 9) | (action.to_square << 3) | (action.promotion or 0)
+
     def getQValue(self, board: chess.Board, action: chess.Move) -> float:
         """
             Returns the Qvalue for a given state and action
@@ -37,7 +107,7 @@ class QLearningAgent(ReinforcementAgent):
             board: The board to get the value for
             action: The move to take from the state
         """
-        return self.q_values[(board.fen(), action)]
+        return self.q_values.get(self._key(self._zobrist(board), action), 0.0)
 
 
     def computeValueFromQValues(self, board: chess.Board) -> float:
@@ -47,14 +117,19 @@ class QLearningAgent(ReinforcementAgent):
             Args:
                 board: The state from which to return the best value
         """
-        if board.is_game_over() or not board.legal_moves:
+        # Fast path: with no Q-values stored for the state every move is worth
+        # 0, so neither the moves nor the game-over test are needed
+        zobrist = self._zobrist(board)
+        if zobrist not in self._learned_states:
+            return 0.0
+
+        moves = self._legal(board)
+        if not moves or board.is_game_over():
             return 0.0
         
-        values = []
-        for move in board.legal_moves:
-            board.push(move)
-            values.append(self.getQValue(board, move))
-            board.pop()
+        # Q-values are keyed on the state the move is taken from, so every
+        # move is looked up under the same key without playing it
+        values = [self.q_values.get(self._key(zobrist, move), 0.0) for move in moves]
         
         return min(values) if self.color == chess.BLACK else max(values)
     
@@ -66,26 +141,19 @@ class QLearningAgent(ReinforcementAgent):
             Args:
                 board: The state from which to return the best action
         """
-        board.turn = self.color
-        if board.is_game_over() or not board.legal_moves:
+        moves = self._legal(board)
+        if not moves or board.is_game_over():
             return None
 
-        bestVal = float('inf') if self.color == chess.BLACK else float('-inf')
-        bestMoves = []
-        for move in board.legal_moves:
-            board.push(move)
-            curVal = self.getQValue(board, move)
-            board.pop()
-            if curVal == bestVal:
-                bestMoves.append(move)
-            if curVal < bestVal and self.color == chess.BLACK: 
-                bestVal = curVal
-                bestMoves = [move]
-            elif curVal > bestVal and self.color == chess.WHITE:
-                bestVal = curVal
-                bestMoves = [move]
+        # Black minimizes: flip the sign once and always maximize
+        sign = -1.0 if self.color == chess.BLACK else 1.0
+        zobrist = self._zobrist(board)
+        q_values, key = self.q_values, self._key
+        scored = [sign * q_values.get(key(zobrist, move), 0.0) for move in moves]
+        bestVal = max(scored)
+        bestMoves = [move for move, value in zip(moves, scored) if value == bestVal]
         
-        return random.choice(bestMoves)
+        return self._rng.choice(bestMoves)
 
     def getAction(self, board: chess.Board) -> chess.Move:
         """
@@ -95,10 +163,9 @@ class QLearningAgent(ReinforcementAgent):
                 board: the state from which the best action should be chosen.
         """
         # Pick Action
-        board.turn = self.color
         action = None
-        if flipCoin(self.epsilon):
-            action = random.choice(list(board.legal_moves))
+        if self._rng.random() < self.epsilon:
+            action = self._rng.choice(self._legal(board))
         else:
             action = self.computeActionFromQValues(board)
 
@@ -111,8 +178,10 @@ class QLearningAgent(ReinforcementAgent):
         Args:
             The ending state of the board
         """
-        deltaReward = evaluate(board) - evaluate(self.lastState)
-        self.observeTransition(self.lastState, self.lastAction, board, deltaReward)
+        deltaReward = evaluate(board) - self.lastStateEval
+        # lastState holds the Zobrist key of the state, see train()
+        self.episodeRewards += deltaReward
+        self._update(self.lastState, self.lastAction, board, deltaReward)
         self.stopEpisode()
 
     def registerInitialState(self, board: chess.Board):
@@ -132,27 +201,108 @@ class QLearningAgent(ReinforcementAgent):
                 reward: The reward for the action taken
 
         """
+        self._update(self._zobrist(board), action, nextBoard, reward)
+
+    def _update(self, zobrist: int, action: chess.Move, nextBoard: chess.Board, reward: int):
+        """
+            Performs state update for a state given by its Zobrist key
+
+            Args:
+                zobrist: Zobrist key of the state the action was taken from
+                action: The chosen action
+                nextBoard: The board state after performing the action
+                reward: The reward for the action taken
+        """
         sample = reward + self.discount*self.computeValueFromQValues(nextBoard)
-        self.q_values[(board.fen(), action)] = (1-self.alpha)*self.getQValue(board, action)+self.alpha*sample
+        key = self._key(zobrist, action)
+        self.q_values[key] = (1-self.alpha)*self.q_values.get(key, 0.0)+self.alpha*sample
+        self._learned_states.add(zobrist)
 
-    def train(self):
+    def train(self, checkpoint_episodes: Iterable[int] = ()):
         """
         Train a QLearning agent against an opponent making random moves
+
+        Args:
+            checkpoint_episodes: Episode counts after which to store a copy
+                of the Q-table in self.checkpoints, so one run yields the
+                agent at several training levels
         """
-        for _ in range(self.numTraining):
-            board = chess.Board()
+        checkpoint_episodes = set(checkpoint_episodes)
+        for episode in range(1, self.numTraining + 1):
+            board = HashedBoard()
             self.startEpisode()
             while not board.is_game_over():
                 if board.turn == self.color:
-                    state = board.copy()
-                    action = self.getAction(state)
+                    # One board for the whole episode: the update only needs
+                    # the state's Zobrist key, so the state is not copied
+                    # and lastState holds that key
+                    state = board.zobrist_key
+                    action = self.getAction(board)
                     self.doAction(state, action)
+                    # Kept for final(), which scores the episode's last transition
+                    self.lastStateEval = evaluate(board)
                     board.push(action)
-                    nextState = board
-                    reward = evaluate(nextState) - evaluate(state)
-                    self.observeTransition(state, action, nextState, reward)
+                    reward = evaluate(board) - self.lastStateEval
+                    self.episodeRewards += reward
+                    self._update(state, action, board, reward)
                 else:
-                    opp_moves = list(board.legal_moves)
+                    opp_moves = self._legal(board)
                     if opp_moves:
-                        board.push(random.choice(opp_moves))
-            self.final(board)
\ No newline at end of file
+                        board.push(self._rng.choice(opp_moves))
+            self.final(board)
+            if episode in checkpoint_episodes:
+                self.checkpoints[episode] = dict(self.q_values)
+
+    def load_checkpoint(self, episodes: int):
+        """
+        Replace the Q-table with the snapshot taken after the given number
+        of training episodes.
+
+        Args:
+            episodes: An episode count passed in checkpoint_episodes
+        """
+        self.q_values = defaultdict(float, self.checkpoints[episodes])
+        self._learned_states = {key >> 15 for key in self.q_values}
+
+    def train_parallel(self, workers: int):
+        """
+        Train independent QLearning agents on a share of the episodes each,
+        in a pool of processes, and merge their Q-tables into this agent.
+
+        A Q-value learned by several workers is averaged over those workers.
+
+        Args:
+            workers: Number of worker processes
+        """
+        workers = min(workers, self.numTraining)
+        params = dict(alpha=self.alpha, epsilon=self.epsilon, gamma=self.discount,
+                      name=self.name, color=self.color)
+        jobs = [(self.numTraining // workers + (i < self.numTraining % workers), self._rng.getrandbits(32), params)
+                for i in range(workers)]
+
+        with multiprocessing.Pool(processes=workers) as pool:
+            results = pool.map(_train_worker, jobs)
+
+        totals = defaultdict(float)
+        counts = defaultdict(int)
+        for q_values, rewards in results:
+            for key, value in q_values.items():
+                totals[key] += value
+                counts[key] += 1
+            self.accumTrainRewards += rewards
+        for key, total in totals.items():
+            self.q_values[key] = total / counts[key]
+            self._learned_states.add(key >> 15)
+
+        # Same end state as after the last episode of train()
+        self.episodesSoFar = self.numTraining
+        self.epsilon = 0.0
+        self.alpha = 0.0
+
+
+def _train_worker(job) -> tuple:
+    """Pool worker for QLearningAgent.train_parallel: train one agent, return its Q-table and rewards."""
+    episodes, seed, params = job
+    # Distinct seed per worker so the workers play different games
+    agent = QLearningAgent(numTraining=episodes, seed=seed, **params)
+    return dict(agent.q_values), agent.accumTrainRewards
@@ -5,6 +5,8 @@ import chess
 class SearchAgent(BaseAgent):
     """Agent that uses a search algorithm to select moves."""
     
+    __slots__ = ("search", "depth")
+    
     def __init__(self, search_algorithm: SearchAlgorithm, depth: int = 3, name: str = "SearchAgent", color: chess.Color = chess.BLACK):
         """Initialize search-based agent.
         
@@ -27,8 +29,9 @@ class SearchAgent(BaseAgent):
         Returns:
             The chosen move
         """
-        move, eval_score = self.search.search(board, self.depth)
-        self.nodes_searched += self.search.nodes_searched
+        search = self.search
+        move, _ = search.search(board, self.depth)
+        self.nodes_searched += search.nodes_searched
         return move
     
     def get_search_info(self) -> dict:
@@ -46,6 +49,8 @@ class SearchAgent(BaseAgent):
 class MinimaxAgent(SearchAgent):
     """Agent that uses Minimax search algorithm."""
     
+    __slots__ = ()
+    
     def __init__(self, evaluator, depth: int = 3, name: str = "MinimaxAgent", color: chess.Color = chess.BLACK):
         """Initialize Minimax agent.
         
@@ -61,6 +66,8 @@ class MinimaxAgent(SearchAgent):
 class AlphaBetaAgent(SearchAgent):
     """Agent that uses Alpha-Beta pruning search algorithm."""
     
+    __slots__ = ()
+    
     def __init__(self, evaluator, depth: int = 3, name: str = "AlphaBetaAgent", color: chess.Color = chess.BLACK):
         """Initialize Alpha-Beta agent.
         
@@ -76,6 +83,8 @@ class AlphaBetaAgent(SearchAgent):
 class ExpectimaxAgent(SearchAgent):
     """Agent that uses Expectimax search algorithm."""
     
+    __slots__ = ()
+    
     def __init__(self, evaluator, depth: int = 3, name: str = "ExpectimaxAgent", color: chess.Color = chess.BLACK):
         """Initialize Expectimax agent.
         
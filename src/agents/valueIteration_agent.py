@@ -1,15 +1,26 @@
+import copy
 import evaluation
+import operator
+import os
 import sys
 from collections import defaultdict
 import random
 from .learning_agent import ValueEstimationAgent
 import chess
-from utils import flipCoin
+import chess.polyglot
+from utils import geometricTrials
 import concurrent.futures
 
+# Chance of adding each opponent state to the states (chosen to minimize training time)
+NEW_STATE_PROBABILITY = 0.01
+# Default cap on the state set. Each sweep samples six to eight times as many
+# new states as it swept, at about 15 ms per swept state, so without a cap
+# every extra iteration is several times slower than the last
+MAX_STATES = 250
+
 class ValueIterationAgent(ValueEstimationAgent):
     """Value iteration agent."""
-    def __init__(self, discount = 0.9, iterations = 3, name="ValueIterationAgent", color=chess.BLACK):
+    def __init__(self, discount = 0.9, iterations = 3, name="ValueIterationAgent", color=chess.BLACK, seed=None, max_states=MAX_STATES):
         """
         Initialize value iteration agent.
 
@@ -18,52 +29,88 @@ class ValueIterationAgent(ValueEstimationAgent):
             iterations: Number of times value iteration should be run
             name: Name of agent
             color: Color agent plays
+            seed: Seed for the agent's own random generator, used to break ties
+            max_states: Most states to sweep; sampled states beyond it are dropped
         """
         super().__init__(epsilon=0.1, name=name, color=color)
+        self._rng = random.Random(seed)
+        # The agent's color is fixed, so whether it minimizes or maximizes is
+        # chosen once here instead of per move
+        self._aggregate = min if color == chess.BLACK else max
+        self._is_better = operator.lt if color == chess.BLACK else operator.gt
+        self._initial_best = float('inf') if color == chess.BLACK else float('-inf')
         self.discount = discount
         self.iterations = iterations
+        self.max_states = max_states
+        # Values are keyed by Zobrist hash; states maps each key to the FEN
+        # its board is rebuilt from
         self.values = defaultdict(float)
         self.states = self.getStates()
-        self.newStates = set()
+        self.newStates = {}
+        # Opponent replies left until the next one is added to the states
+        self._sample_countdown = geometricTrials(NEW_STATE_PROBABILITY)
+        # Size of the state set after each sweep, so one run gives the whole growth curve
+        self.states_per_iter = []
         self.runValueIteration()
 
     def _update_state(self, state):
-        curBoard = chess.Board(state)
+        key, fen = state
+        curBoard = chess.Board(fen)
         curBoard.turn = chess.BLACK
         if evaluation.is_endgame(curBoard):
-            return (state, 0)
+            return (key, 0)
         best_action = self.computeActionFromValues(curBoard)
         if not best_action:
-            return (state, 0)
+            return (key, 0)
         else:
-            return (state, self.computeQValueFromValues(curBoard, best_action))
+            return (key, self.computeQValueFromValues(curBoard, best_action))
 
     def runValueIteration(self):
         """Performs value iteration"""
         for _ in range(self.iterations):
             newVals = defaultdict(float)
 
-            with concurrent.futures.ProcessPoolExecutor() as executor:
-                results = executor.map(self._update_state, self.states)
-
-            for state, value in results:
-                newVals[state] = value
+            # The agent, values included, is sent to each worker once by the
+            # initializer rather than pickled with every state, and states
+            # are sent in chunks. Workers never read the state set, so the
+            # copy they get leaves it out.
+            worker_agent = copy.copy(self)
+            worker_agent.states = {}
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(self.states) // (workers * 4))
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=(worker_agent,)) as executor:
+                # Results are stored as each chunk arrives, while later
+                # chunks are still being computed
+                for state, value, new_states in executor.map(_update_state_in_worker, self.states.items(),
+                                                             chunksize=chunksize):
+                    newVals[state] = value
+                    # States sampled in the workers are merged here, since
+                    # the workers' own newStates never reach this process
+                    self.newStates.update(new_states)
 
             self.values = newVals
-            self.states.update(self.newStates)
-            self.newStates = set()
-
-    def getStates(self) -> set[str]:
+            # Sampled states are added in the order they were found until
+            # the set reaches max_states
+            for key, fen in self.newStates.items():
+                if len(self.states) >= self.max_states:
+                    break
+                self.states[key] = fen
+            self.newStates = {}
+            self.states_per_iter.append(len(self.states))
+
+    def getStates(self) -> dict[int, str]:
         """
         Get the initial states to create the value table.
 
         The initial states include a board with no moves, and any possible initial move.
+        Returns a dict mapping each state's Zobrist hash to its FEN.
         """
-        states = set()
+        states = {}
         board = chess.Board()
         for move in board.legal_moves:
             board.push(move)
-            states.add(board.fen())
+            states[chess.polyglot.zobrist_hash(board)] = board.fen()
             board.pop()
         
         return states
@@ -77,17 +124,17 @@ class ValueIterationAgent(ValueEstimationAgent):
         """
         return self.computeActionFromValues(board)
     
-    def getValue(self, state: str) -> float:
+    def getValue(self, state: int) -> float:
         """
             Return the value of the state (computed in __init__).
 
             Args:
-                Fen string representation of board state to get the value for.
+                Zobrist hash of the board state to get the value for.
         """
         return self.values[state]
 
 
-    def computeQValueFromValues(self, board: chess.Board, action: chess.Move):
+    def computeQValueFromValues(self, board: chess.Board, action: chess.Move, state_eval=None):
         """
             Compute the Q-value of action in state from the value function stored in self.values.
 
@@ -97,6 +144,7 @@ class ValueIterationAgent(ValueEstimationAgent):
             Args:
                 board: the current board state
                 action: The move to compute QValue from.
+                state_eval: evaluate(board), if the caller already has it
         """
         board.push(action)
         board.turn = chess.WHITE if self.color == chess.BLACK else chess.BLACK
@@ -106,16 +154,24 @@ class ValueIterationAgent(ValueEstimationAgent):
             cur_values = []
             for move in opp_actions:
                 board.push(move)
-                if flipCoin(0.01): # with 1% probability add opponent state to states
-                    self.newStates.add(board.fen())
-                cur_values.append(self.getValue(board.fen()))
+                key = chess.polyglot.zobrist_hash(board)
+                # Each opponent state is added to states with probability
+                # NEW_STATE_PROBABILITY; drawing the gap to the next one
+                # replaces a coin flip per reply
+                self._sample_countdown -= 1
+                if not self._sample_countdown:
+                    self.newStates[key] = board.fen()
+                    self._sample_countdown = geometricTrials(NEW_STATE_PROBABILITY)
+                cur_values.append(self.getValue(key))
                 board.pop()
-            value = min(cur_values) if self.color == chess.BLACK else max(cur_values)
+            value = self._aggregate(cur_values)
         else:
-            value = self.getValue(board.fen())
+            value = self.getValue(chess.polyglot.zobrist_hash(board))
         
         board.pop()
-        return evaluation.evaluate(board) + self.discount*value
+        if state_eval is None:
+            state_eval = evaluation.evaluate(board)
+        return state_eval + self.discount*value
 
     def computeActionFromValues(self, board: chess.Board):
         """
@@ -126,20 +182,45 @@ class ValueIterationAgent(ValueEstimationAgent):
         """
         if board.is_game_over():
             return None
-        bestQ = float('inf') if self.color == chess.BLACK else float('-inf')
-        bestActions = []
+        bestQ = self._initial_best
+        bestAction = None
+        ties = 0
+        is_better = self._is_better
+        rand = self._rng.random
+        # Every action's Q-value starts from the same state's evaluation
+        state_eval = evaluation.evaluate(board)
         for move in board.legal_moves:
-            curQ = self.computeQValueFromValues(board, move)
+            curQ = self.computeQValueFromValues(board, move, state_eval)
             if curQ == bestQ:
-                bestActions.append(move)
-                continue
-            if self.color == chess.BLACK:
-                if curQ < bestQ:
-                    bestQ = curQ
-                    bestActions = [move]
-            elif self.color == chess.WHITE:
-                if curQ > bestQ:
-                    bestQ = curQ
-                    bestActions = [move] 
-
-        return random.choice(bestActions)
\ No newline at end of file
+                # Reservoir sampling: the n-th tied move replaces the choice
+                # with probability 1/n, so ties are broken uniformly
+                ties += 1
+                if rand() * ties < 1:
+                    bestAction = move
+            elif is_better(curQ, bestQ):
+                bestQ = curQ
+                bestAction = move
+                ties = 1
+
+        return bestAction
+
+
+# Agent sweeping states in this worker process, set by _init_worker
+_worker_agent = None
+
+
+def _init_worker(agent):
+    """Pool initializer: keep this sweep's copy of the agent in the worker."""
+    global _worker_agent
+    _worker_agent = agent
+
+
+def _update_state_in_worker(state):
+    """
+    Pool worker: compute the new value of one (key, fen) state. Returns
+    (key, value, new_states), where new_states holds the (key, fen) pairs
+    sampled while computing it.
+    """
+    _worker_agent.newStates = {}
+    key, value = _worker_agent._update_state(state)
+    return key, value, _worker_agent.newStates
@@ -1,6 +1,6 @@
 """Evaluation module."""
 
-from .evaluator import evaluate, is_endgame, get_piece_square_value, evaluate_pawns, evaluate_king_safety
+from .evaluator import evaluate, is_endgame, get_piece_square_value, evaluate_pawns, evaluate_king_safety, clear_eval_cache
 from .piece_square_tables import PIECE_SQUARE_TABLES
 
 __all__ = [
@@ -9,5 +9,6 @@ __all__ = [
     "get_piece_square_value",
     "evaluate_pawns",
     "evaluate_king_safety",
+    "clear_eval_cache",
     "PIECE_SQUARE_TABLES",
 ]
\ No newline at end of file
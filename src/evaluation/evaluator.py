@@ -1,6 +1,8 @@
 """Board evaluation functions."""
 
 import chess
+from collections import OrderedDict
+from typing import Hashable
 from .piece_square_tables import PIECE_SQUARE_TABLES, KING_ENDGAME_TABLE
 
 PIECE_VALUES = {
@@ -20,95 +22,132 @@ PAWN_BONUS = {
     'shield': 15      # Bonus for pawns shielding the king
 }
 
+# Cache of evaluated positions: transposition key -> score. Mate scores
+# depend on the ply they are found at and are never stored. Once it holds
+# EVAL_CACHE_SIZE entries the oldest entry is evicted per insert, in constant
+# time with an OrderedDict. At about 320 bytes per entry the bound is about
+# 16 MB per process; processes that also import the root evaluation.py hold
+# that module's cache as well.
+_EVAL_CACHE: "OrderedDict[Hashable, int]" = OrderedDict()
+EVAL_CACHE_SIZE = 50_000
+
+def _flatten_table(table, color: chess.Color) -> tuple:
+    """Flatten a [rank][file] table into a tuple indexed by square for one color."""
+    if color == chess.WHITE:
+        return tuple(table[chess.square_rank(sq)][chess.square_file(sq)] for sq in chess.SQUARES)
+    return tuple(table[7 - chess.square_rank(sq)][chess.square_file(sq)] for sq in chess.SQUARES)
+
+def _flat_pst(piece_type: chess.PieceType, color: chess.Color, endgame: bool) -> tuple:
+    """Square-indexed table for one piece type; all zeros if it has no table."""
+    if endgame and piece_type == chess.KING:
+        return _flatten_table(KING_ENDGAME_TABLE, color)
+    table = PIECE_SQUARE_TABLES.get(piece_type)
+    if table is None:
+        return (0,) * 64
+    return _flatten_table(table, color)
+
+# Square-indexed tables: FLAT_PST[endgame][color][piece_type][square]. Every
+# piece type has an entry, so lookups never miss.
+FLAT_PST = tuple(
+    tuple(
+        {piece_type: _flat_pst(piece_type, color, endgame) for piece_type in chess.PIECE_TYPES}
+        for color in (chess.BLACK, chess.WHITE)
+    )
+    for endgame in (False, True)
+)
+
+# Material folded into the tables: PSQT[endgame][color] is a list of
+# (piece_type, table) pairs with table[square] = PIECE_VALUES + PST
+PSQT = tuple(
+    tuple(
+        [(piece_type, tuple(PIECE_VALUES[piece_type] + value for value in table))
+         for piece_type, table in FLAT_PST[endgame][color].items()]
+        for color in (chess.BLACK, chess.WHITE)
+    )
+    for endgame in (False, True)
+)
+
+# Pawn structure masks: the files beside each file, and for each color and
+# square the squares ahead of it on its own and adjacent files
+ADJACENT_FILES_BB = tuple(
+    (chess.BB_FILES[f - 1] if f > 0 else 0) | (chess.BB_FILES[f + 1] if f < 7 else 0)
+    for f in range(8)
+)
+FRONT_SPAN_BB = tuple(
+    tuple(
+        (chess.BB_FILES[chess.square_file(sq)] | ADJACENT_FILES_BB[chess.square_file(sq)])
+        & sum(chess.BB_RANKS[r] for r in range(8)
+              if (r > chess.square_rank(sq) if color == chess.WHITE else r < chess.square_rank(sq)))
+        for sq in chess.SQUARES
+    )
+    for color in (chess.BLACK, chess.WHITE)
+)
+
+# Mop-up distances: CENTER_DIST[sq] is a square's rank plus file distance
+# from the central files and ranks, KING_DIST[a * 64 + b] the Manhattan
+# distance between two squares
+CENTER_DIST = tuple(
+    max(3 - chess.square_rank(sq), chess.square_rank(sq) - 4)
+    + max(3 - chess.square_file(sq), chess.square_file(sq) - 4)
+    for sq in chess.SQUARES
+)
+KING_DIST = tuple(
+    abs(chess.square_rank(a) - chess.square_rank(b)) + abs(chess.square_file(a) - chess.square_file(b))
+    for a in chess.SQUARES for b in chess.SQUARES
+)
+
 def is_endgame(board: chess.Board) -> bool:
     """Determine if the game is in endgame phase."""
-    # Fast check: No queens usually means endgame
-    w_queens = len(board.pieces(chess.QUEEN, chess.WHITE))
-    b_queens = len(board.pieces(chess.QUEEN, chess.BLACK))
+    # Popcounts of the board's combined bitboards instead of SquareSets
+    black, white = board.occupied_co
+    queens = board.queens
+    w_queens = chess.popcount(queens & white)
+    b_queens = chess.popcount(queens & black)
     
+    # Fast check: No queens usually means endgame
     if w_queens == 0 and b_queens == 0:
         return True
     
     # Check for "Queen + Pawns" or "Queen + 1 Minor" endings
     if w_queens == 1 and b_queens == 1:
         # Count material without queens/kings/pawns
-        white_minors = len(board.pieces(chess.KNIGHT, chess.WHITE)) + len(board.pieces(chess.BISHOP, chess.WHITE)) + len(board.pieces(chess.ROOK, chess.WHITE))
-        black_minors = len(board.pieces(chess.KNIGHT, chess.BLACK)) + len(board.pieces(chess.BISHOP, chess.BLACK)) + len(board.pieces(chess.ROOK, chess.BLACK))
-        if white_minors + black_minors <= 2:
+        if chess.popcount(board.knights | board.bishops | board.rooks) <= 2:
             return True
             
     return False
 
 def get_piece_square_value(piece: chess.Piece, square: chess.Square, endgame: bool = False) -> int:
     """Get piece-square table value."""
-    piece_type = piece.piece_type
-    
-    # Mirror rank for Black (Tables are defined from White's perspective)
-    if piece.color == chess.WHITE:
-        rank = chess.square_rank(square)
-        file = chess.square_file(square)
-    else:
-        rank = 7 - chess.square_rank(square)
-        file = chess.square_file(square)
-    
-    if piece_type == chess.KING and endgame:
-        table = KING_ENDGAME_TABLE
-    else:
-        table = PIECE_SQUARE_TABLES.get(piece_type)
-        
-    if table is None:
-        return 0
-
-    return table[rank][file]
+    # Black's tables are pre-mirrored, so this is a single indexed load
+    return FLAT_PST[endgame][piece.color][piece.piece_type][square]
 
 def evaluate_pawns(board: chess.Board, color: chess.Color) -> int:
     """
     Evaluate pawn structure nuances: Doubled, Isolated, Passed.
     """
     score = 0
-    pawns = board.pieces(chess.PAWN, color)
-    opp_pawns = board.pieces(chess.PAWN, not color)
-    
-    # Convert bitboard to list of squares for easier iteration
-    pawn_squares = list(pawns)
-    
-    files_with_pawns = [chess.square_file(sq) for sq in pawn_squares]
+    pawns = board.pieces_mask(chess.PAWN, color)
+    opp_pawns = board.pieces_mask(chess.PAWN, not color)
     
-    for sq in pawn_squares:
-        file = chess.square_file(sq)
-        rank = chess.square_rank(sq)
+    for file, file_bb in enumerate(chess.BB_FILES):
+        on_file = chess.popcount(pawns & file_bb)
+        if not on_file:
+            continue
         
         # 1. Doubled Pawns (More than 1 pawn on this file)
-        if files_with_pawns.count(file) > 1:
-            score += PAWN_BONUS['doubled']
+        if on_file > 1:
+            score += PAWN_BONUS['doubled'] * on_file
             
         # 2. Isolated Pawns (No friendly pawns on adjacent files)
-        # Files are 0-7. Left is file-1, Right is file+1
-        has_left_neighbor = (file - 1) in files_with_pawns
-        has_right_neighbor = (file + 1) in files_with_pawns
-        
-        if not has_left_neighbor and not has_right_neighbor:
-            score += PAWN_BONUS['isolated']
-            
-        # 3. Passed Pawns (No enemy pawns ahead on file or adjacent files)
-        is_passed = True
-        # Look at squares in front of us
-        direction = 1 if color == chess.WHITE else -1
-        check_rank = rank + direction
-        
-        while 0 <= check_rank <= 7:
-            # Check file, left, and right on this rank for enemy pawns
-            for f in range(max(0, file - 1), min(8, file + 2)):
-                check_sq = chess.square(f, check_rank)
-                if check_sq in opp_pawns:
-                    is_passed = False
-                    break
-            if not is_passed:
-                break
-            check_rank += direction
-            
-        if is_passed:
+        if not pawns & ADJACENT_FILES_BB[file]:
+            score += PAWN_BONUS['isolated'] * on_file
+    
+    # 3. Passed Pawns (No enemy pawns ahead on file or adjacent files)
+    front_span = FRONT_SPAN_BB[color]
+    for sq in chess.scan_forward(pawns):
+        if not opp_pawns & front_span[sq]:
             # Bonus increases as pawn advances
+            rank = chess.square_rank(sq)
             advancement = rank if color == chess.WHITE else (7 - rank)
             score += PAWN_BONUS['passed'] + (advancement * 10)
 
@@ -148,33 +187,40 @@ def evaluate(board: chess.Board, ply_from_root: int = 0) -> int:
     """
     Comprehensive evaluation function.
     """
-    if board.is_stalemate() or board.is_insufficient_material():
+    # Tuple of the board's bitboards, far cheaper to build than a zobrist hash
+    key = board._transposition_key()
+    score = _EVAL_CACHE.get(key)
+    if score is not None:
+        return score
+
+    # Stalemate needs the side to move out of check, so the cheap check test
+    # decides which full test (if any) is worth running
+    if board.is_check():
+        if board.is_checkmate():
+            # Prefer faster mates
+            return -20000 + ply_from_root if board.turn == chess.WHITE else 20000 - ply_from_root
+    elif board.is_stalemate():
+        _cache_score(key, 0)
         return 0
 
-    if board.is_checkmate():
-        # Prefer faster mates
-        return -20000 + ply_from_root if board.turn == chess.WHITE else 20000 - ply_from_root
+    # Insufficient material needs no pawns, rooks or queens on the board
+    if not (board.pawns | board.rooks | board.queens) and board.is_insufficient_material():
+        _cache_score(key, 0)
+        return 0
 
     endgame = is_endgame(board)
     score = 0
     
     # 1. Material & Piece-Square Tables
-    white_material = 0
-    black_material = 0
-    
-    # piece_map() is faster than iterating all squares
-    for square, piece in board.piece_map().items():
-        material = PIECE_VALUES[piece.piece_type]
-        pst = get_piece_square_value(piece, square, endgame)
-        
-        val = material + pst
-        
-        if piece.color == chess.WHITE:
-            score += val
-            white_material += material
-        else:
-            score -= val
-            black_material += material
+    # One table lookup per piece, walking the set bits of each piece
+    # bitboard directly rather than building SquareSets
+    pieces_mask = board.pieces_mask
+    for piece_type, table in PSQT[endgame][chess.WHITE]:
+        for sq in chess.scan_forward(pieces_mask(piece_type, chess.WHITE)):
+            score += table[sq]
+    for piece_type, table in PSQT[endgame][chess.BLACK]:
+        for sq in chess.scan_forward(pieces_mask(piece_type, chess.BLACK)):
+            score -= table[sq]
 
     # 2. Pawn Structure
     score += evaluate_pawns(board, chess.WHITE)
@@ -187,6 +233,15 @@ def evaluate(board: chess.Board, ply_from_root: int = 0) -> int:
 
     # 4. Endgame Mop-up
     if endgame:
+        # Popcounts of each piece bitboard against the color masks read once
+        black_occupied, white_occupied = board.occupied_co
+        white_material = black_material = 0
+        for bb, piece_type in ((board.pawns, chess.PAWN), (board.knights, chess.KNIGHT),
+                               (board.bishops, chess.BISHOP), (board.rooks, chess.ROOK),
+                               (board.queens, chess.QUEEN), (board.kings, chess.KING)):
+            material = PIECE_VALUES[piece_type]
+            white_material += material * chess.popcount(bb & white_occupied)
+            black_material += material * chess.popcount(bb & black_occupied)
         winning_side = None
         # Require significant material lead to attempt mop-up
         if white_material > black_material + 200:
@@ -199,17 +254,20 @@ def evaluate(board: chess.Board, ply_from_root: int = 0) -> int:
             losing_king = board.king(not winning_side)
             
             if cmd_king is not None and losing_king is not None:
-                mop_up = 0
-                
-                # Push losing king to edge
-                l_rank, l_file = chess.square_rank(losing_king), chess.square_file(losing_king)
-                mop_up += (max(3 - l_rank, l_rank - 4) + max(3 - l_file, l_file - 4)) * 10
-                
-                # Bring winning king closer
-                w_rank, w_file = chess.square_rank(cmd_king), chess.square_file(cmd_king)
-                dist = abs(w_rank - l_rank) + abs(w_file - l_file)
-                mop_up += (14 - dist) * 5
+                # Push losing king to edge, bring winning king closer
+                mop_up = CENTER_DIST[losing_king] * 10 + (14 - KING_DIST[cmd_king * 64 + losing_king]) * 5
                 
                 score += mop_up if winning_side == chess.WHITE else -mop_up
 
-    return score
\ No newline at end of file
+    _cache_score(key, score)
+    return score
+
+def _cache_score(key: Hashable, score: int) -> None:
+    """Store an evaluation, evicting the oldest entry if the cache is full."""
+    if len(_EVAL_CACHE) >= EVAL_CACHE_SIZE:
+        _EVAL_CACHE.popitem(last=False)
+    _EVAL_CACHE[key] = score
+
+def clear_eval_cache() -> None:
+    """Forget all cached evaluations."""
+    _EVAL_CACHE.clear()
@@ -174,6 +174,16 @@ class ChessGUI:
         
         square_size = 60
         
+        # Bind what the 64-square loop reads to locals once per redraw
+        piece_at = self.board.piece_at
+        create_rectangle = self.board_canvas.create_rectangle
+        create_text = self.board_canvas.create_text
+        piece_symbols = self.PIECE_SYMBOLS
+        selected_square = self.selected_square
+        last_move = self.last_move
+        # Only highlight last move if no square is selected
+        highlighted = (last_move.from_square, last_move.to_square) if last_move and selected_square is None else ()
+        
         # Draw squares with white at bottom (rank 0 = a1 at bottom, rank 7 = a8 at top)
         # Visual: visual_rank 0 at top shows chess rank 7 (black), visual_rank 7 at bottom shows chess rank 0 (white)
         for visual_rank in range(8):
@@ -190,15 +200,13 @@ class ChessGUI:
                 # Determine square color based on chess coordinates (not visual)
                 is_light = (chess_rank + file) % 2 == 0
                 color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
-                if self.selected_square == square:
+                if selected_square == square:
                     color = self.SELECTED_SQUARE
-                elif self.last_move and (square == self.last_move.from_square or square == self.last_move.to_square):
-                    # Only highlight last move if no square is selected
-                    if self.selected_square is None:
-                        color = self.LAST_MOVE_SQUARE
+                elif square in highlighted:
+                    color = self.LAST_MOVE_SQUARE
                 
                 # Draw square
-                self.board_canvas.create_rectangle(
+                create_rectangle(
                     x1, y1, x2, y2,
                     fill=color,
                     outline='black',
@@ -207,18 +215,17 @@ class ChessGUI:
                 )
                 
                 # Draw piece if present
-                piece = self.board.piece_at(square)
+                piece = piece_at(square)
                 if piece:
-                    symbol = self.PIECE_SYMBOLS[piece.piece_type][
-                        'white' if piece.color == chess.WHITE else 'black'
-                    ]
+                    side = 'white' if piece.color == chess.WHITE else 'black'
+                    symbol = piece_symbols[piece.piece_type][side]
                     center_x = x1 + square_size // 2
                     center_y = y1 + square_size // 2
-                    self.board_canvas.create_text(
+                    create_text(
                         center_x, center_y,
                         text=symbol,
                         font=('Arial', 36, 'bold'),
-                        fill='white' if piece.color == chess.WHITE else 'black'
+                        fill=side
                     )
         
         # Draw file labels (a-h)
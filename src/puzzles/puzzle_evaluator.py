@@ -1,7 +1,9 @@
 """Evaluate AI agents on chess puzzles."""
+import os
 import time
 import chess
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from .puzzle import Puzzle
 from ..agents import BaseAgent
@@ -196,6 +198,13 @@ class PuzzleEvaluator:
             original_depth = agent.depth
             agent.depth = depth
         
+        # Learning agents play greedily on puzzles; their learned values are
+        # kept, only exploration is switched off
+        original_epsilon = None
+        if hasattr(agent, 'epsilon'):
+            original_epsilon = agent.epsilon
+            agent.epsilon = 0.0
+        
         for i, puzzle in enumerate(puzzles, 1):
             if self.verbose and i % 10 == 0:
                 print(f"Progress: {i}/{len(puzzles)} ({solved_count}/{i} solved, "
@@ -210,6 +219,8 @@ class PuzzleEvaluator:
         # Restore original depth
         if original_depth is not None:
             agent.depth = original_depth
+        if original_epsilon is not None:
+            agent.epsilon = original_epsilon
         
         report = EvaluationReport(
             agent_name=agent.name,
@@ -306,6 +317,10 @@ class PuzzleEvaluator:
         """
         Compare multiple agents on the same puzzle set.
         
+        Each agent is used as-is for the whole puzzle set and never reset, so
+        search caches (the transposition table, which is aged rather than
+        cleared per search) and learned Q-values carry over between puzzles.
+        
         Args:
             agents: List of agents to compare
             puzzles: Puzzles to solve
@@ -329,6 +344,62 @@ class PuzzleEvaluator:
         
         return reports
     
+    def compare_agents_parallel(
+        self,
+        agent_factories: List[Callable[[], BaseAgent]],
+        puzzles: List[Puzzle],
+        depth: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> Dict[str, EvaluationReport]:
+        """
+        Compare multiple agents on the same puzzle set, solving the puzzles
+        across a process pool.
+        
+        Agents are not sent to the workers; each worker builds its own from
+        the factories, which must be picklable (module-level functions or
+        functools.partial objects over them), once per factory.
+        
+        Args:
+            agent_factories: Zero-argument callables that build the agents
+            puzzles: Puzzles to solve
+            depth: Optional search depth override
+            workers: Number of worker processes (default: one per CPU)
+            
+        Returns:
+            Dictionary mapping agent names to their reports
+        """
+        jobs = [(index, factory, puzzle, depth)
+                for index, factory in enumerate(agent_factories)
+                for puzzle in puzzles]
+        names: Dict[int, str] = {}
+        results: Dict[int, List[PuzzleResult]] = {index: [] for index in range(len(agent_factories))}
+        
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map keeps job order, so each agent's results stay in puzzle order
+            for index, name, result in executor.map(_solve_in_worker, jobs, chunksize=chunksize):
+                names[index] = name
+                results[index].append(result)
+        
+        reports = {}
+        for index, agent_results in results.items():
+            if index not in names:
+                continue
+            report = EvaluationReport(
+                agent_name=names[index],
+                total_puzzles=len(agent_results),
+                solved=sum(1 for r in agent_results if r.solved),
+                results=agent_results
+            )
+            if self.verbose:
+                report.print_summary()
+            reports[names[index]] = report
+        
+        self._print_comparison(reports)
+        
+        return reports
+    
     def _print_comparison(self, reports: Dict[str, EvaluationReport]):
         """Print a comparison table of multiple agents."""
         print("\n" + "=" * 70)
@@ -344,4 +415,25 @@ class PuzzleEvaluator:
                   f"{report.avg_time:.3f}s{'':<6} "
                   f"{report.avg_nodes:,.0f}")
         
-        print("=" * 70 + "\n")
\ No newline at end of file
+        print("=" * 70 + "\n")
+
+
+# Agents built inside a pool worker, keyed by factory index, so a worker
+# constructs (and trains) each agent once however many puzzles it solves
+_worker_agents: Dict[int, BaseAgent] = {}
+
+
+def _solve_in_worker(job: Tuple[int, Callable[[], BaseAgent], Puzzle, Optional[int]]) -> Tuple[int, str, PuzzleResult]:
+    """Pool worker for compare_agents_parallel: solve one puzzle with one agent."""
+    index, factory, puzzle, depth = job
+    agent = _worker_agents.get(index)
+    if agent is None:
+        agent = factory()
+        if depth is not None and hasattr(agent, 'depth'):
+            agent.depth = depth
+        if hasattr(agent, 'epsilon'):
+            agent.epsilon = 0.0
+        _worker_agents[index] = agent
+    evaluator = PuzzleEvaluator(verbose=False)
+    result = evaluator._evaluate_puzzle(agent, puzzle, depth or getattr(agent, 'depth', 0))
+    return index, agent.name, result
@@ -28,6 +28,8 @@ class PuzzleLoader:
         self.csv_path = Path(csv_path)
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
+        # Every puzzle in the file, parsed on the first load_all call
+        self._all_puzzles: Optional[List[Puzzle]] = None
         
     def load(
         self,
@@ -67,6 +69,45 @@ class PuzzleLoader:
                 
         return puzzles
     
+    def load_all(
+        self,
+        min_rating: Optional[int] = None,
+        max_rating: Optional[int] = None
+    ) -> List[Puzzle]:
+        """Load every puzzle in the CSV file, reading the file only once.
+        
+        The parsed puzzles are kept on the loader, so later calls (and
+        filter_by_theme) filter them in memory instead of re-reading the file.
+        
+        Args:
+            min_rating: Minimum puzzle rating to include
+            max_rating: Maximum puzzle rating to include
+        
+        Returns:
+            List of Puzzle objects matching the filters
+        """
+        if self._all_puzzles is None:
+            with open(self.csv_path, newline='', encoding='utf-8') as csvfile:
+                self._all_puzzles = [self._parse_row(row) for row in csv.DictReader(csvfile)]
+        
+        if min_rating is None and max_rating is None:
+            return list(self._all_puzzles)
+        return [puzzle for puzzle in self._all_puzzles
+                if self._passes_filters(puzzle, min_rating, max_rating, None, None)]
+    
+    def filter_by_theme(self, theme: str, limit: Optional[int] = None) -> List[Puzzle]:
+        """Get puzzles with a theme from the in-memory puzzle list.
+        
+        Args:
+            theme: Theme the puzzles must include
+            limit: Maximum number of puzzles to return
+        
+        Returns:
+            List of Puzzle objects with the theme, in file order
+        """
+        matching = [puzzle for puzzle in self.load_all() if puzzle.has_theme(theme)]
+        return matching[:limit] if limit else matching
+    
     def _parse_row(self, row: dict) -> Puzzle:
         """
         Parse a CSV row into a Puzzle object.
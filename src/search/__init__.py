@@ -3,11 +3,15 @@ from .search_base import SearchAlgorithm
 from .minimax import MiniMaxSearch
 from .alphabeta import AlphaBetaSearch
 from .expectimax import ExpectimaxSearch
+from .transposition import TranspositionTable
+from .hashed_board import HashedBoard
 
 __all__ = [
     'SearchAlgorithm',
     'MiniMaxSearch',
     'AlphaBetaSearch',
-    'ExpectimaxSearch'
+    'ExpectimaxSearch',
+    'TranspositionTable',
+    'HashedBoard'
 ]
 
@@ -1,16 +1,20 @@
 """Alpha-beta pruning search algorithm."""
 
 import chess
-from typing import Callable, List, Tuple, Optional
+from typing import Callable, Iterator, List, Tuple, Optional
 from .search_base import SearchAlgorithm
+from .transposition import TranspositionTable, EXACT, LOWER, UPPER, score_from_tt
+from .hashed_board import HashedBoard
 
 class AlphaBetaSearch(SearchAlgorithm):
     """
-    Alpha-beta pruning with Move Ordering and Quiescence Search.
+    Alpha-beta pruning with Iterative Deepening, Move Ordering, Quiescence
+    Search and a transposition table that persists across searches.
     """
     
-    def __init__(self, evaluator: Callable[[chess.Board, int], int]):
+    def __init__(self, evaluator: Callable[[chess.Board, int], int], tt_size: int = 1 << 20):
         super().__init__(evaluator)
+        self.tt = TranspositionTable(tt_size)
         # MVV-LVA (Most Valuable Victim - Least Valuable Aggressor) values
         # Used for move ordering
         self.piece_values = {
@@ -24,14 +28,31 @@ class AlphaBetaSearch(SearchAlgorithm):
     
     def search(self, board: chess.Board, depth: int) -> Tuple[chess.Move, int]:
         self.reset_stats()
+        self.tt.new_search()
+        best_move = None
+        best_value = 0
+        
+        # Search on a board that keeps its Zobrist key current move by move
+        if not isinstance(board, HashedBoard):
+            board = HashedBoard.from_board(board)
+        
+        # Iterative deepening: each shallower pass fills the transposition
+        # table with best moves that order the next, deeper pass
+        for current_depth in range(1, max(depth, 1) + 1):
+            best_move, best_value = self._search_root(board, current_depth, best_move)
+        
+        return best_move, best_value
+
+    def _search_root(self, board: chess.Board, depth: int,
+                     pv_move: Optional[chess.Move]) -> Tuple[Optional[chess.Move], float]:
         best_move = None
         
         # Initial alpha/beta
         alpha = float('-inf')
         beta = float('inf')
         
-        # Root level move ordering
-        moves = self._order_moves(board, list(board.legal_moves))
+        # Root level move ordering, previous iteration's best move first
+        moves = self._ordered_moves(board, pv_move)
         
         # We need to track best value to return correct move
         # Initialize based on whose turn it is
@@ -77,34 +98,64 @@ class AlphaBetaSearch(SearchAlgorithm):
         if depth == 0:
             return self._quiescence(board, alpha, beta, maximizing, ply_from_root)
 
-        # 2. Move Ordering
-        # Generate moves and sort them so we search captures first
-        moves = self._order_moves(board, list(board.legal_moves))
+        # 2. Transposition Table
+        # A result from an equal or deeper search either settles this node
+        # or narrows the window
+        key = board.zobrist_key
+        entry = self.tt.probe(key)
+        if entry is not None and entry.depth >= depth:
+            tt_score = score_from_tt(entry.score, ply_from_root)
+            if entry.flag == EXACT:
+                return tt_score
+            if entry.flag == LOWER:
+                alpha = max(alpha, tt_score)
+            else:
+                beta = min(beta, tt_score)
+            if alpha >= beta:
+                return tt_score
+        alpha_orig, beta_orig = alpha, beta
+
+        # 3. Move Ordering
+        # The best move stored for this position by any earlier search comes
+        # first, then the rest sorted so we search captures first
+        moves = self._ordered_moves(board, entry.best_move if entry is not None else None)
 
+        best_move = None
         if maximizing:
-            max_eval = float('-inf')
+            best_eval = float('-inf')
             for move in moves:
                 board.push(move)
                 eval_score = self._alpha_beta(board, depth - 1, alpha, beta, False, ply_from_root + 1)
                 board.pop()
                 
-                max_eval = max(max_eval, eval_score)
+                if eval_score > best_eval:
+                    best_eval = eval_score
+                    best_move = move
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
                     break # Beta cutoff
-            return max_eval
         else:
-            min_eval = float('inf')
+            best_eval = float('inf')
             for move in moves:
                 board.push(move)
                 eval_score = self._alpha_beta(board, depth - 1, alpha, beta, True, ply_from_root + 1)
                 board.pop()
                 
-                min_eval = min(min_eval, eval_score)
+                if eval_score < best_eval:
+                    best_eval = eval_score
+                    best_move = move
                 beta = min(beta, eval_score)
                 if beta <= alpha:
                     break # Alpha cutoff
-            return min_eval
+
+        if best_eval <= alpha_orig:
+            flag = UPPER
+        elif best_eval >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(key, depth, best_eval, flag, best_move, ply_from_root)
+        return best_eval
 
     def _quiescence(self, board: chess.Board, alpha: float, beta: float, 
                    maximizing: bool, ply_from_root: int) -> float:
@@ -130,7 +181,7 @@ class AlphaBetaSearch(SearchAlgorithm):
 
         # 2. Search only Captures
         # We only look at moves that capture pieces
-        capture_moves = self._order_moves(board, [m for m in board.legal_moves if board.is_capture(m)])
+        capture_moves = self._order_moves(board, list(board.generate_legal_captures()))
         
         if maximizing:
             for move in capture_moves:
@@ -155,6 +206,20 @@ class AlphaBetaSearch(SearchAlgorithm):
                     beta = score
             return beta
 
+    def _ordered_moves(self, board: chess.Board, first: Optional[chess.Move]) -> Iterator[chess.Move]:
+        """
+        Yield the legal moves with `first` (if legal) ahead of the rest.
+
+        `first` is yielded before the other moves are generated and sorted,
+        so a cutoff on it skips that work entirely.
+        """
+        if first is not None and board.is_legal(first):
+            yield first
+        else:
+            first = None
+        for move in self._order_moves(board, [m for m in board.legal_moves if m != first]):
+            yield move
+
     def _order_moves(self, board: chess.Board, moves: List[chess.Move]) -> List[chess.Move]:
         # Delegate to shared ordering in SearchAlgorithm
         return super()._order_moves(board, moves)
\ No newline at end of file
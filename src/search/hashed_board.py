@@ -0,0 +1,133 @@
+"""Board that keeps its Polyglot Zobrist key up to date move by move."""
+
+import chess
+import chess.polyglot
+from typing import Callable, List, Optional, Union
+
+_RANDOM = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+_HASHER = chess.polyglot.ZobristHasher(_RANDOM)
+_TURN_KEY = _RANDOM[780]
+
+
+def piece_key(piece_type: chess.PieceType, color: chess.Color, square: chess.Square) -> int:
+    """Polyglot random number for a piece of piece_type and color on square."""
+    return _RANDOM[64 * ((piece_type - 1) * 2 + color) + square]
+
+
+class HashedBoard(chess.Board):
+    """
+    Board that keeps chess.polyglot.zobrist_hash(board) in .zobrist_key,
+    updated on every push and pop instead of rehashing all pieces. Any other
+    change to the position (set_fen, set_piece_at, reset, ...) clears the
+    move stack and rehashes, as do the copies root(), mirror() and
+    transform() return.
+
+    Example usage:
+        >>> board = HashedBoard()
+        >>> board.push_san("e4")
+        >>> board.zobrist_key == chess.polyglot.zobrist_hash(board)
+        True
+    """
+
+    def __init__(self, fen: Optional[str] = chess.STARTING_FEN, *, chess960: bool = False) -> None:
+        self.zobrist_key = 0
+        self._zobrist_keys: List[int] = []
+        super().__init__(fen, chess960=chess960)
+
+    @classmethod
+    def from_board(cls, board: chess.Board) -> "HashedBoard":
+        """Copy board, including its move stack, into a new HashedBoard."""
+        if isinstance(board, cls):
+            return board.copy()
+        hashed = cls(board.root().fen(), chess960=board.chess960)
+        for move in board.move_stack:
+            hashed.push(move)
+        return hashed
+
+    def push(self, move: chess.Move) -> None:
+        self._zobrist_keys.append(self.zobrist_key)
+        # Every move flips the side to move. En passant is rehashed only when
+        # there is an en passant square, castling only when the move can
+        # change the castling rights (a king move or a move to or from a
+        # castling rook's square).
+        key = self.zobrist_key ^ _TURN_KEY
+        if self.ep_square is not None:
+            key ^= _HASHER.hash_ep_square(self)
+        castling_changes = False
+
+        if move:
+            color = self.turn
+            from_square, to_square = move.from_square, move.to_square
+            piece_type = self.piece_type_at(from_square)
+            castling_changes = bool(self.castling_rights) and (
+                piece_type == chess.KING
+                or bool(self.castling_rights & (chess.BB_SQUARES[from_square] | chess.BB_SQUARES[to_square])))
+
+            if piece_type == chess.KING and self.is_castling(move):
+                # Castling moves the king to the g or c file and the rook
+                # beside it, whichever notation the move uses
+                rank = chess.square_rank(from_square)
+                rook_square = self._to_chess960(move).to_square
+                if chess.square_file(rook_square) > chess.square_file(from_square):
+                    king_to, rook_to = chess.square(6, rank), chess.square(5, rank)
+                else:
+                    king_to, rook_to = chess.square(2, rank), chess.square(3, rank)
+                key ^= piece_key(chess.KING, color, from_square) ^ piece_key(chess.KING, color, king_to)
+                key ^= piece_key(chess.ROOK, color, rook_square) ^ piece_key(chess.ROOK, color, rook_to)
+            elif piece_type is not None:
+                captured = self.piece_type_at(to_square)
+                if captured is not None:
+                    key ^= piece_key(captured, not color, to_square)
+                elif piece_type == chess.PAWN and to_square == self.ep_square:
+                    captured_square = to_square - 8 if color == chess.WHITE else to_square + 8
+                    key ^= piece_key(chess.PAWN, not color, captured_square)
+                key ^= piece_key(piece_type, color, from_square)
+                key ^= piece_key(move.promotion or piece_type, color, to_square)
+
+        if castling_changes:
+            key ^= _HASHER.hash_castling(self)
+            super().push(move)
+            key ^= _HASHER.hash_castling(self)
+        else:
+            super().push(move)
+        if self.ep_square is not None:
+            key ^= _HASHER.hash_ep_square(self)
+        self.zobrist_key = key
+
+    def pop(self) -> chess.Move:
+        move = super().pop()
+        self.zobrist_key = self._zobrist_keys.pop()
+        return move
+
+    def clear_stack(self) -> None:
+        super().clear_stack()
+        self._rehash()
+
+    def _rehash(self) -> None:
+        """Recompute the key from scratch and forget the keys of earlier positions."""
+        self.zobrist_key = chess.polyglot.zobrist_hash(self)
+        self._zobrist_keys = []
+
+    def root(self) -> "HashedBoard":
+        # The root position is restored after the new board has hashed itself
+        board = super().root()
+        board._rehash()
+        return board
+
+    def apply_transform(self, f: Callable[[chess.Bitboard], chess.Bitboard]) -> None:
+        # chess.Board clears the stack before moving the en passant square
+        # and castling rights
+        super().apply_transform(f)
+        self._rehash()
+
+    def apply_mirror(self) -> None:
+        # Colors and turn are swapped after the transform has rehashed
+        super().apply_mirror()
+        self._rehash()
+
+    def copy(self, *, stack: Union[bool, int] = True) -> "HashedBoard":
+        board = super().copy(stack=stack)
+        board.zobrist_key = self.zobrist_key
+        if stack:
+            board._zobrist_keys = self._zobrist_keys[-len(board.move_stack):] if board.move_stack else []
+        return board
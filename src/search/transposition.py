@@ -0,0 +1,113 @@
+"""Zobrist-keyed transposition table for the search algorithms."""
+
+import chess
+from typing import List, Optional
+
+# Bound flags: the stored score is exact, a lower bound (the search failed
+# high) or an upper bound (the search failed low).
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# evaluate() scores a mate as +/-(20000 - ply); anything beyond this is a mate
+MATE_THRESHOLD = 19000
+
+
+class TTEntry:
+    """One stored search result."""
+
+    __slots__ = ("key", "depth", "score", "flag", "best_move", "age")
+
+    def __init__(self, key: int, depth: int, score: float, flag: int,
+                 best_move: Optional[chess.Move], age: int):
+        self.key = key
+        self.depth = depth
+        self.score = score
+        self.flag = flag
+        self.best_move = best_move
+        self.age = age
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table indexed by the low bits of a Zobrist key.
+
+    Each slot holds one entry. A store replaces the slot's entry if it comes
+    from an earlier search, or if the new result is at least as deep.
+
+    Example usage:
+        >>> tt = TranspositionTable()
+        >>> key = chess.polyglot.zobrist_hash(board)
+        >>> tt.store(key, depth, score, EXACT, best_move, ply)
+        >>> entry = tt.probe(key)
+    """
+
+    def __init__(self, size: int = 1 << 20):
+        """
+        Initialize the table.
+
+        Args:
+            size: Number of slots, rounded up to a power of two
+        """
+        slots = 1
+        while slots < size:
+            slots <<= 1
+        self._entries: List[Optional[TTEntry]] = [None] * slots
+        self._mask = slots - 1
+        self.age = 0
+
+    def new_search(self) -> None:
+        """Mark entries stored so far as belonging to an earlier search."""
+        self.age += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries = [None] * len(self._entries)
+        self.age = 0
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """Return the entry stored for key, or None."""
+        entry = self._entries[key & self._mask]
+        if entry is not None and entry.key == key:
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, score: float, flag: int,
+              best_move: Optional[chess.Move], ply_from_root: int = 0) -> None:
+        """
+        Store a search result.
+
+        Args:
+            key: Zobrist key of the position
+            depth: Remaining depth the position was searched to
+            score: Score found, relative to the root (as the search returns it)
+            flag: EXACT, LOWER or UPPER
+            best_move: Best move found, if any
+            ply_from_root: Distance of the position from the root
+        """
+        index = key & self._mask
+        entry = self._entries[index]
+        if entry is None or entry.age != self.age or depth >= entry.depth:
+            self._entries[index] = TTEntry(key, depth, score_to_tt(score, ply_from_root),
+                                           flag, best_move, self.age)
+
+
+def score_to_tt(score: float, ply_from_root: int) -> float:
+    """
+    Make a mate score relative to the stored position rather than the root,
+    so it stays correct when the position is reached at another ply.
+    """
+    if score > MATE_THRESHOLD:
+        return score + ply_from_root
+    if score < -MATE_THRESHOLD:
+        return score - ply_from_root
+    return score
+
+
+def score_from_tt(score: float, ply_from_root: int) -> float:
+    """Inverse of score_to_tt for a position probed at ply_from_root."""
+    if score > MATE_THRESHOLD:
+        return score - ply_from_root
+    if score < -MATE_THRESHOLD:
+        return score + ply_from_root
+    return score
@@ -1,5 +1,7 @@
 import chess
-from engine import find_best_move, find_best_move_alpha_beta, minimax, alpha_beta
+from engine import find_best_move, find_best_move_alpha_beta, minimax, alpha_beta, alpha_beta_iterative, clear_search_tables, \
+    EvalState, push_and_update, pop_and_restore, evaluate_incremental
+from evaluation import evaluate_static
 
 
 def test_captures_free_piece():
@@ -72,6 +74,77 @@ def test_alphabeta_equals_minimax():
     print("Alpha-beta equals minimax test passed")
 
 
+def test_iterative_alphabeta_equals_recursive():
+    """The explicit-stack alpha-beta should return the same values as the recursive one"""
+    fens = [
+        chess.STARTING_FEN,
+        "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+        "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 0 1",
+    ]
+    
+    for fen in fens:
+        for depth in (1, 2, 3):
+            board = chess.Board(fen)
+            clear_search_tables()
+            recursive_value = alpha_beta(board, depth, float('-inf'), float('inf'), board.turn == chess.WHITE)
+            clear_search_tables()
+            iterative_value = alpha_beta_iterative(board, depth, float('-inf'), float('inf'), board.turn == chess.WHITE)
+            
+            assert recursive_value == iterative_value, \
+                f"Values differ at depth {depth} for {fen}: {recursive_value} vs {iterative_value}"
+            assert board.fen() == fen, "Search should leave the board unchanged"
+    
+    print("Iterative alpha-beta equals recursive test passed")
+
+
+def test_alphabeta_finds_mate_in_one():
+    """Iterative deepening alpha-beta should keep the mate found at shallow depth"""
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 0 1")
+    
+    best_move = find_best_move_alpha_beta(board, depth=3)
+    
+    assert best_move.uci() == "h5f7", f"Should play Qxf7#, but played {best_move}"
+    
+    print("Alpha-beta finds mate in one test passed")
+
+
+def test_minimax_and_alphabeta_keep_separate_tables():
+    """minimax should not pick up alpha_beta's quiescence scores from a shared table"""
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4")
+    
+    clear_search_tables()
+    fresh = minimax(board, 2, True)
+    clear_search_tables()
+    alpha_beta(board, 2, float('-inf'), float('inf'), True)
+    assert minimax(board, 2, True) == fresh, "minimax should not reuse alpha_beta's entries"
+    
+    clear_search_tables()
+    fresh = alpha_beta(board, 2, float('-inf'), float('inf'), True)
+    clear_search_tables()
+    minimax(board, 2, True)
+    assert alpha_beta(board, 2, float('-inf'), float('inf'), True) == fresh, "alpha_beta should not reuse minimax's entries"
+    
+    print("Separate transposition tables test passed")
+
+
+def test_eval_state_tracks_static_eval():
+    """EvalState's incremental score should match a full evaluation through pushes and pops"""
+    board = chess.Board()
+    state = EvalState(board)
+    moves = ["e2e4", "d7d5", "e4d5", "d8d5", "b1c3", "d5a5", "g1f3", "c8g4", "f1e2", "b8c6",
+             "e1g1", "e8c8", "d2d4", "e7e5", "d4e5", "c6e5", "f3e5", "g4e2", "d1e2", "a5e5"]
+    
+    for uci in moves:
+        push_and_update(board, chess.Move.from_uci(uci), state)
+        assert evaluate_incremental(board, state) == evaluate_static(board), f"Score drifted after {uci}"
+    
+    while board.move_stack:
+        pop_and_restore(board, state)
+        assert evaluate_incremental(board, state) == evaluate_static(board), "Score drifted after pop"
+    
+    print("EvalState tracks static eval test passed")
+
+
 def test_prefers_better_material_trade():
     """AI should prefer winning trades (taking more than it loses)"""
     # Position where AI can trade knight for queen
@@ -107,6 +180,18 @@ def test_handles_no_legal_moves():
     print("Handles no legal moves test passed")
 
 
+def test_leaf_scores_draws_as_zero():
+    """Stalemate and insufficient material at a depth-0 leaf should score 0, not material"""
+    stalemate = chess.Board("k7/8/1QK5/8/8/8/8/8 b - - 0 1")
+    knight_vs_king = chess.Board("k7/8/2K5/8/8/8/8/6N1 b - - 0 1")
+    
+    for board in (stalemate, knight_vs_king):
+        assert alpha_beta(board, 0, float('-inf'), float('inf'), False) == 0, f"{board.fen()} should be a draw"
+        assert alpha_beta_iterative(board, 0, float('-inf'), float('inf'), False) == 0, f"{board.fen()} should be a draw"
+    
+    print("Leaf draw scoring test passed")
+
+
 def test_depth_consistency():
     """Higher depth should make same or better decisions"""
     board = chess.Board()
@@ -132,8 +217,13 @@ def run_all_tests():
     test_avoids_hanging_piece()
     test_finds_mate_in_one()
     test_alphabeta_equals_minimax()
+    test_iterative_alphabeta_equals_recursive()
+    test_alphabeta_finds_mate_in_one()
+    test_minimax_and_alphabeta_keep_separate_tables()
+    test_eval_state_tracks_static_eval()
     test_prefers_better_material_trade()
     test_handles_no_legal_moves()
+    test_leaf_scores_draws_as_zero()
     test_depth_consistency()
     
     print("\n" + "="*50)
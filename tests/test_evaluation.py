@@ -4,7 +4,8 @@ import sys
 project_root = pathlib.Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
-from src.evaluation import evaluate, is_endgame, get_piece_square_value, evaluate_pawns, evaluate_king_safety
+from src.evaluation import evaluate, is_endgame, get_piece_square_value, evaluate_pawns, evaluate_king_safety, clear_eval_cache
+from src.evaluation.piece_square_tables import PIECE_SQUARE_TABLES, KING_ENDGAME_TABLE
 
 
 def test_starting_position():
@@ -185,9 +186,45 @@ def test_piece_square_symmetry():
     value_black = get_piece_square_value(piece_black, chess.D5)
     
     assert value_white == value_black, f"Piece-square values should be symmetric. White: {value_white}, Black: {value_black}"
+    
+    # Every piece on every square, in both game phases
+    for endgame in (False, True):
+        for piece_type in chess.PIECE_TYPES:
+            for square in chess.SQUARES:
+                white = get_piece_square_value(chess.Piece(piece_type, chess.WHITE), square, endgame)
+                black = get_piece_square_value(chess.Piece(piece_type, chess.BLACK), chess.square_mirror(square), endgame)
+                assert white == black, f"Asymmetric {chess.piece_name(piece_type)} value on {chess.square_name(square)}"
     print("Piece-square symmetry test passed")
 
 
+def test_piece_square_values_all_piece_types():
+    """Every piece type should have a piece-square value matching its [rank][file] table"""
+    for piece_type in chess.PIECE_TYPES:
+        for endgame in (False, True):
+            if endgame and piece_type == chess.KING:
+                table = KING_ENDGAME_TABLE
+            else:
+                table = PIECE_SQUARE_TABLES.get(piece_type)
+            for square in chess.SQUARES:
+                expected = table[chess.square_rank(square)][chess.square_file(square)] if table else 0
+                value = get_piece_square_value(chess.Piece(piece_type, chess.WHITE), square, endgame)
+                assert value == expected, f"Wrong {chess.piece_name(piece_type)} value on {chess.square_name(square)}"
+    print("Piece-square values for all piece types test passed")
+
+
+def test_eval_cache():
+    """Cached scores should match fresh ones, and mate scores should still depend on ply"""
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+    clear_eval_cache()
+    fresh = evaluate(board)
+    assert evaluate(board) == fresh, "Cached score should equal the fresh score"
+    
+    board.push_san("Qxf7#")
+    assert evaluate(board, 1) == 20000 - 1
+    assert evaluate(board, 3) == 20000 - 3, "Mate scores should not be cached"
+    print("Eval cache test passed")
+
+
 def test_doubled_pawns_penalty():
     """Doubled pawns should be penalized."""
     board = chess.Board(None)
@@ -264,6 +301,8 @@ def run_all_tests():
     test_endgame_detection()
     test_king_safety_middlegame()
     test_piece_square_symmetry()
+    test_piece_square_values_all_piece_types()
+    test_eval_cache()
     
     print("\n" + "="*50)
     print("All tests passed! ✓")
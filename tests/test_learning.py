@@ -81,6 +81,35 @@ def test_qlearning_updates_qvalues():
     print(f"Q-Learning updates Q-values (now has {len(agent.q_values)} entries)")
 
 
+def test_qlearning_parallel_training():
+    """Training split across worker processes should leave a merged, trained agent."""
+    agent = QLearningAgent(numTraining=2, epsilon=0.5, alpha=0.5, gamma=0.9, color=chess.WHITE, workers=2)
+    
+    assert len(agent.q_values) > 0, "Merged Q-values should be populated"
+    assert agent.episodesSoFar == 2
+    assert agent.epsilon == 0.0 and agent.alpha == 0.0, "Training wheels should be off after training"
+    
+    board = chess.Board()
+    assert agent.choose_move(board) in board.legal_moves
+    print(f"Q-Learning parallel training merged {len(agent.q_values)} Q-values")
+
+
+def test_qlearning_checkpoints():
+    """One training run should leave a Q-table snapshot at each requested episode count."""
+    agent = QLearningAgent(numTraining=3, epsilon=0.5, alpha=0.5, gamma=0.9, color=chess.WHITE,
+                           seed=0, checkpoint_episodes=[1, 3])
+    
+    assert sorted(agent.checkpoints) == [1, 3]
+    assert agent.checkpoints[3] == dict(agent.q_values), "Last snapshot should match the trained table"
+    assert len(agent.checkpoints[1]) <= len(agent.checkpoints[3])
+    
+    agent.load_checkpoint(1)
+    assert dict(agent.q_values) == agent.checkpoints[1]
+    board = chess.Board()
+    assert agent.choose_move(board) in board.legal_moves
+    print(f"Q-Learning checkpoints at episodes {sorted(agent.checkpoints)}")
+
+
 # VALUE ITERATION TESTS
 
 vi_agent = ValueIterationAgent(discount=0.9, iterations=2, color=chess.WHITE)
@@ -127,6 +156,27 @@ def test_value_iteration_expands_states():
     print(f"Value Iteration expands states: {initial_states} -> {len(agent.states)}")
 
 
+def test_value_iteration_grows_state_curve():
+    """States sampled during each sweep should be added, so states_per_iter grows."""
+    agent = ValueIterationAgent(discount=0.9, iterations=2, color=chess.BLACK)
+    
+    curve = agent.states_per_iter
+    assert len(curve) == 2
+    assert all(a <= b for a, b in zip(curve, curve[1:])), "State count should never shrink"
+    assert curve[-1] > 20, "Sampled states should be added to the initial 20"
+    assert len(agent.states) == curve[-1]
+    print(f"Value Iteration state curve: {curve}")
+
+
+def test_value_iteration_caps_states():
+    """The state set should stop growing at max_states."""
+    agent = ValueIterationAgent(discount=0.9, iterations=3, color=chess.BLACK, max_states=50)
+    
+    assert len(agent.states) == 50, "Sampled states should fill the set up to the cap"
+    assert max(agent.states_per_iter) <= 50
+    print(f"Value Iteration state curve with a cap of 50: {agent.states_per_iter}")
+
+
 def test_value_iteration_computes_qvalues():
     """Value Iteration should compute Q-values for actions."""
     board = chess.Board()
@@ -187,6 +237,8 @@ def run_all_tests():
     test_qlearning_finds_mate_in_one()
     test_qlearning_avoids_hanging_piece()
     test_qlearning_updates_qvalues()
+    test_qlearning_parallel_training()
+    test_qlearning_checkpoints()
     
     print("\n" + "="*50)
     print("Running Value Iteration Agent Tests")
@@ -196,6 +248,8 @@ def run_all_tests():
     test_value_iteration_chooses_legal_move()
     test_value_iteration_has_state_values()
     test_value_iteration_expands_states()
+    test_value_iteration_grows_state_curve()
+    test_value_iteration_caps_states()
     test_value_iteration_computes_qvalues()
     test_value_iteration_finds_best_action()
     
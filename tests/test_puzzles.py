@@ -54,6 +54,28 @@ def test_puzzle_filtering():
     print("\nTest 2 PASSED")
 
 
+def test_puzzle_theme_cache():
+    """Test that in-memory theme filtering matches loading from the file."""
+    print("\n" + "=" * 70)
+    print("TEST: Cached Theme Filtering")
+    print("=" * 70)
+    
+    sample_file = project_root / "data" / "sample_puzzles.csv"
+    
+    loader = PuzzleLoader(str(sample_file))
+    all_puzzles = loader.load_all()
+    assert len(all_puzzles) == len(loader.load()), "load_all should return every puzzle"
+    
+    for theme in ['mateIn2', 'short', 'endgame']:
+        cached = loader.filter_by_theme(theme, limit=3)
+        loaded = loader.load(themes=[theme], limit=3)
+        print(f"  {theme}: {len(cached)} puzzles")
+        assert [p.puzzle_id for p in cached] == [p.puzzle_id for p in loaded], \
+            f"Theme filter should match load() for {theme}"
+    
+    print("\nTest PASSED")
+
+
 def test_puzzle_evaluation():
     """Test evaluating an agent on puzzles."""
     print("\n" + "=" * 70)
@@ -123,6 +145,7 @@ def run_all_tests():
     try:
         test_puzzle_loading()
         test_puzzle_filtering()
+        test_puzzle_theme_cache()
         test_puzzle_evaluation()
         test_puzzle_board_setup()
         
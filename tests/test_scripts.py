@@ -0,0 +1,65 @@
+"""Tests for the match-running scripts."""
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import chess
+from scripts.play_agents import make_agents_play_parallel
+from scripts.tournament import run_tournament
+import agent_tournament
+
+
+def test_parallel_games_with_value_iteration():
+    """Pooled games should run with a ValueIterationAgent, which starts its own process pool."""
+    white_spec = ("random", chess.WHITE, {})
+    black_spec = ("valueiteration", chess.BLACK, {"vi_iterations": 1})
+
+    results = make_agents_play_parallel(white_spec, black_spec, iterations=2, processes=2)
+    
+    assert sum(results.values()) == 2, "Both games should be played"
+    assert results["error"] == 0, f"No game should end in an error: {results}"
+    print("Parallel games with a ValueIterationAgent ran")
+
+
+def test_agent_tournament_parallel_with_value_iteration():
+    """agent_tournament.py --processes should run with a ValueIterationAgent side."""
+    argv = sys.argv
+    sys.argv = ["agent_tournament.py", "--white-agent", "random", "--black-agent", "valueiteration",
+                "--num-games", "2", "--vi-iterations", "1", "--processes", "2"]
+    try:
+        agent_tournament.main()
+    finally:
+        sys.argv = argv
+    print("agent_tournament parallel games with a ValueIterationAgent ran")
+
+
+def test_tournament_parallel_with_value_iteration():
+    """A pooled round-robin should run with a ValueIterationAgent entrant."""
+    ratings, records = run_tournament(["random", "valueiteration"], games_per_pair=2, vi_iterations=1, processes=2)
+    
+    assert set(ratings) == {"random", "valueiteration"}
+    games = sum(rec["wins"] + rec["losses"] + rec["draws"] for rec in records.values())
+    assert games == 4, "Each game should count once for both players"
+    print(f"Tournament with a ValueIterationAgent ran: {ratings}")
+
+
+def run_all_tests():
+    print("\n" + "="*50)
+    print("Running Script Tests")
+    print("="*50 + "\n")
+
+    test_parallel_games_with_value_iteration()
+    test_agent_tournament_parallel_with_value_iteration()
+    test_tournament_parallel_with_value_iteration()
+
+    print("\n" + "="*50)
+    print("All script tests passed! ✓")
+    print("="*50 + "\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -8,7 +8,8 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 import chess
-from src.search import MiniMaxSearch, AlphaBetaSearch, ExpectimaxSearch
+import chess.polyglot
+from src.search import HashedBoard, MiniMaxSearch, AlphaBetaSearch, ExpectimaxSearch
 from src.evaluation import evaluate
 
 
@@ -54,6 +55,57 @@ def test_alphabeta_prunes():
     print(f"Alpha-beta prunes (searched {alphabeta.nodes_searched}/{minimax.nodes_searched} nodes)")
 
 
+def test_alphabeta_reuses_transposition_table():
+    """A warm transposition table should not change alpha-beta's result."""
+    board = chess.Board("6k1/5ppp/8/8/8/8/r4PPP/6K1 b - - 0 1")
+    
+    alphabeta = AlphaBetaSearch(evaluate)
+    first_move, first_score = alphabeta.search(board, depth=3)
+    first_nodes = alphabeta.nodes_searched
+    second_move, second_score = alphabeta.search(board, depth=3)
+    
+    assert (second_move, second_score) == (first_move, first_score), \
+        f"Results should match: {second_move} {second_score} vs {first_move} {first_score}"
+    assert alphabeta.nodes_searched < first_nodes, \
+        f"Second search should hit the table: {alphabeta.nodes_searched} vs {first_nodes}"
+    print(f"Alpha-beta reuses transposition table ({alphabeta.nodes_searched}/{first_nodes} nodes)")
+
+
+def test_hashed_board_matches_polyglot():
+    """Incremental Zobrist keys should equal a full rehash after every push and pop."""
+    board = HashedBoard("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+    # En passant, castling both ways, a promotion capturing a rook (which
+    # takes away a castling right), and a null move
+    moves = ["e5d6", "e8g8", "b7a8q", "g8g7", "e1c1", "0000", "h1h7"]
+    for uci in moves:
+        board.push(chess.Move.from_uci(uci))
+        assert board.zobrist_key == chess.polyglot.zobrist_hash(board), f"Key differs after {uci}"
+    while board.move_stack:
+        board.pop()
+        assert board.zobrist_key == chess.polyglot.zobrist_hash(board), "Key differs after pop"
+    print("Hashed board matches polyglot")
+
+
+def test_hashed_board_copies_are_rehashed():
+    """root(), mirror() and transform() should return boards with fresh keys."""
+    board = HashedBoard("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    for uci in ["e1g1", "e8c8", "a1a7"]:
+        board.push(chess.Move.from_uci(uci))
+    board.push(chess.Move.from_uci("c8b8"))
+    
+    copies = {
+        "root": board.root(),
+        "mirror": board.mirror(),
+        "transform": board.transform(chess.flip_horizontal),
+    }
+    for name, copy in copies.items():
+        assert copy.zobrist_key == chess.polyglot.zobrist_hash(copy), f"Key is stale after {name}()"
+    
+    board.apply_mirror()
+    assert board.zobrist_key == chess.polyglot.zobrist_hash(board), "Key is stale after apply_mirror()"
+    print("Hashed board copies are rehashed")
+
+
 def test_captures_hanging_piece():
     """Should capture free pieces."""
     board = chess.Board()
@@ -143,6 +195,9 @@ def run_all_tests():
     test_finds_mate_in_one()
     test_alphabeta_equals_minimax()
     test_alphabeta_prunes()
+    test_alphabeta_reuses_transposition_table()
+    test_hashed_board_matches_polyglot()
+    test_hashed_board_copies_are_rehashed()
     test_captures_hanging_piece()
     
     print("\n" + "="*50)
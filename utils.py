@@ -1,8 +1,17 @@
 # Utility functions for chess AI
+import math
 import random
 
 def flipCoin(epsilon: float):
   r = random.random()
   if r < epsilon:
     return True
-  return False
\ No newline at end of file
+  return False
+
+def geometricTrials(p: float):
+  """
+  Number of flipCoin(p) calls up to and including the next True, drawn
+  with a single random number. Requires 0 < p < 1.
+  """
+  r = random.random()
+  return int(math.log(1.0 - r) / math.log(1.0 - p)) + 1